@@ -832,8 +832,7 @@ def test_vrf_with_multiple_links_p1(request):
     intf2 = topo_modify["routers"]["r2"]["links"]["r3-link3"]["interface"]
 
     interfaces = [intf1, intf2]
-    for intf in interfaces:
-        shutdown_bringup_interface(tgen, "r2", intf, False)
+    shutdown_bringup_interface(tgen, "r2", interfaces, False)
 
     for addr_type in ADDR_TYPES:
         dut = "r3"
@@ -880,8 +879,7 @@ def test_vrf_with_multiple_links_p1(request):
 
     step("Unshut the interfaces between R2 and R3 for vrfs RED_A and BLUE_A.")
 
-    for intf in interfaces:
-        shutdown_bringup_interface(tgen, "r2", intf, True)
+    shutdown_bringup_interface(tgen, "r2", interfaces, True)
 
     for addr_type in ADDR_TYPES:
         dut = "r3"
@@ -1081,8 +1079,7 @@ def test_vrf_with_multiple_links_p1(request):
 
     step("Shutdown links between between R2 and R3 for vrfs RED_A and" " BLUE_A.")
 
-    for intf in interfaces:
-        shutdown_bringup_interface(tgen, "r2", intf, False)
+    shutdown_bringup_interface(tgen, "r2", interfaces, False)
 
     for addr_type in ADDR_TYPES:
         dut = "r3"
@@ -1128,8 +1125,7 @@ def test_vrf_with_multiple_links_p1(request):
 
     step("Bringup links between between R2 and R3 for vrfs RED_A and" " BLUE_A.")
 
-    for intf in interfaces:
-        shutdown_bringup_interface(tgen, "r2", intf, True)
+    shutdown_bringup_interface(tgen, "r2", interfaces, True)
 
     step("Deleting manualy assigned ip address from router r1 and r4 interfaces")
     raw_config = {"r1": {"raw_config": r1_config}, "r4": {"raw_config": r4_config}}
@@ -1555,8 +1551,7 @@ def test_shut_noshut_p1(request):
         intf4 = topo["routers"]["r1"]["links"]["r2-link4"]["interface"]
 
         interfaces = [intf1, intf2, intf3, intf4]
-        for intf in interfaces:
-            shutdown_bringup_interface(tgen, "r1", intf, False)
+        shutdown_bringup_interface(tgen, "r1", interfaces, False)
 
         step(
             "On R2, all BGP peering in respective vrf instances go down"
@@ -1616,8 +1611,7 @@ def test_shut_noshut_p1(request):
             assert result is not True, "Testcase {} : Failed \nExpected Behaviour: Routes are flushed out \nError {}".format(tc_name, result)
 
         step("Bring up connecting interface between R1<<>>R2 on R1.")
-        for intf in interfaces:
-            shutdown_bringup_interface(tgen, "r1", intf, True)
+        shutdown_bringup_interface(tgen, "r1", interfaces, True)
 
         step(
             "R2 restores BGP peering and routing tables in all vrf "
@@ -4,7 +4,6 @@ Topotest conftest.py file.
 
 import glob
 import os
-import pdb
 import re
 import pytest
 
@@ -176,7 +175,10 @@ def pytest_configure(config):
     Assert that the environment is correctly configured, and get extra config.
     """
 
-    if not diagnose_env():
+    # Only listing tests or printing help doesn't need a working topology
+    # environment, so don't pay for the diagnostics in those cases.
+    skip_diagnose = config.getoption("--collect-only") or config.getoption("--help")
+    if not skip_diagnose and not diagnose_env():
         pytest.exit("environment has errors, please read the logs")
 
     asan_abort = config.getoption("--asan-abort")
@@ -292,4 +294,6 @@ def pytest_runtest_makereport(item, call):
         except NameError:
             user = input('Testing paused, "pdb" to debug, "Enter" to continue: ')
         if user.strip() == "pdb":
+            import pdb
+
             pdb.set_trace()
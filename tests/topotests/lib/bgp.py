@@ -330,10 +330,7 @@ def __create_bgp_global(tgen, input_dict, router, build=False):
         if "timer" in bgp_data["graceful-restart"]:
             timer = bgp_data["graceful-restart"]["timer"]
 
-            if "delete" in timer:
-                del_action = timer["delete"]
-            else:
-                del_action = False
+            del_action = timer.get("delete", False)
 
             for rs_timer, value in timer.items():
                 rs_timer_value = timer.setdefault(rs_timer, None)
@@ -393,10 +390,7 @@ def __create_bgp_unicast_neighbor(
             if type(network) is not list:
                 network = [network]
 
-            if "no_of_network" in advertise_network_dict:
-                no_of_network = advertise_network_dict["no_of_network"]
-            else:
-                no_of_network = 1
+            no_of_network = advertise_network_dict.get("no_of_network", 1)
 
             del_action = advertise_network_dict.setdefault("delete", False)
 
@@ -2746,10 +2740,7 @@ def verify_bgp_rib(
 
                     network = static_route["network"]
 
-                    if "no_of_ip" in static_route:
-                        no_of_ip = static_route["no_of_ip"]
-                    else:
-                        no_of_ip = 1
+                    no_of_ip = static_route.get("no_of_ip", 1)
 
                     # Generating IPs for verification
                     ip_list = generate_ips(network, no_of_ip)
@@ -2923,10 +2914,7 @@ def verify_bgp_rib(
 
                     network = advertise_network_dict["network"]
 
-                    if "no_of_network" in advertise_network_dict:
-                        no_of_network = advertise_network_dict["no_of_network"]
-                    else:
-                        no_of_network = 1
+                    no_of_network = advertise_network_dict.get("no_of_network", 1)
 
                     # Generating IPs for verification
                     ip_list = generate_ips(network, no_of_network)
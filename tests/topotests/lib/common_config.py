@@ -23,7 +23,6 @@ from datetime import datetime, timedelta
 from time import sleep
 from copy import deepcopy
 from subprocess import call
-from subprocess import STDOUT as SUB_STDOUT
 from subprocess import PIPE as SUB_PIPE
 from subprocess import Popen
 from functools import wraps
@@ -47,8 +46,8 @@ except ImportError:
     import configparser
 
 from lib.topolog import logger, logger_config
-from lib.topogen import TopoRouter, get_topogen
-from lib.topotest import interface_set_status, version_cmp, frr_unicode
+from lib.topogen import TopoRouter, get_topogen, run_on_gears
+from lib.topotest import interface_set_status, version_cmp, frr_unicode, get_file
 
 FRRCFG_FILE = "frr_json.conf"
 FRRCFG_BKUP_FILE = "frr_json_initial.conf"
@@ -138,11 +137,14 @@ DEBUG_LOGS = {
     ],
 }
 
+try:
+    string_types = basestring
+except NameError:
+    string_types = str
+
+
 def is_string(value):
-    try:
-        return isinstance(value, basestring)
-    except NameError:
-        return isinstance(value, str)
+    return isinstance(value, string_types)
 
 if config.has_option("topogen", "verbosity"):
     loglevel = config.get("topogen", "verbosity")
@@ -497,14 +499,25 @@ def reset_config_on_routers(tgen, routerName=None):
         f.close()
         run_cfg_file = "{}/{}/frr.sav".format(TMPDIR, rname)
         init_cfg_file = "{}/{}/frr_json_initial.conf".format(TMPDIR, rname)
-        command = "/usr/lib/frr/frr-reload.py --test --test-reset --input {} {} > {}".format(
-            run_cfg_file, init_cfg_file, dname
-        )
-        result = call(command, shell=True, stderr=SUB_STDOUT, stdout=SUB_PIPE)
+        command = [
+            "/usr/lib/frr/frr-reload.py",
+            "--test",
+            "--test-reset",
+            "--input",
+            run_cfg_file,
+            init_cfg_file,
+        ]
+        # Run frr-reload directly and write the delta file ourselves instead
+        # of going through a shell for the redirection. Nothing reads its
+        # diagnostics, so do not hand it a pipe that could fill up.
+        with open(dname, "w") as delta_file, open(os.devnull, "w") as devnull:
+            result = call(command, stdout=delta_file, stderr=devnull)
 
         # Assert if command fail
         if result > 0:
-            logger.error("Delta file creation failed. Command executed %s", command)
+            logger.error(
+                "Delta file creation failed. Command executed %s", " ".join(command)
+            )
             with open(run_cfg_file, "r") as fd:
                 logger.info(
                     "Running configuration saved in %s is:\n%s", run_cfg_file, fd.read()
@@ -1662,7 +1675,7 @@ def retry(retry_timeout, initial_wait=0, expected=True, diag_pct=0.75):
                     ret = func(*args, **kwargs)
                     logger.debug("Function returned %s", ret)
 
-                    negative_result = ret is False or is_string(ret)
+                    negative_result = ret is False or isinstance(ret, string_types)
                     if negative_result == invert_logic:
                         # Simple case, successful result in time
                         if not saved_failure:
@@ -2590,7 +2603,10 @@ def shutdown_bringup_interface(tgen, dut, intf_name, ifaceaction=False):
     Shutdown or bringup router's interface "
     * `tgen`  : Topogen object
     * `dut`  : Device under test
-    * `intf_name`  : Interface name to be shut/no shut
+    * `intf_name`  : Interface name to be shut/no shut, or a list of
+                     interface names to be shut/no shut with a single
+                     vtysh invocation, vtysh stops at the first failing
+                     command so the interfaces after it are left untouched
     * `ifaceaction` :  Action, to shut/no shut interface,
                        by default is False
     Usage
@@ -2601,6 +2617,8 @@ def shutdown_bringup_interface(tgen, dut, intf_name, ifaceaction=False):
     shutdown_bringup_interface(tgen, dut, intf, False)
     # Bring up interface
     shutdown_bringup_interface(tgen, dut, intf, True)
+    # Shut down several interfaces at once
+    shutdown_bringup_interface(tgen, dut, ["r3-r1-eth0", "r3-r2-eth1"], False)
     Returns
     -------
     errormsg(str) or True
@@ -2615,6 +2633,25 @@ def shutdown_bringup_interface(tgen, dut, intf_name, ifaceaction=False):
     interface_set_status(router_list[dut], intf_name, ifaceaction)
 
 
+def run_ip_batch(rnode, commands):
+    """
+    Runs the iproute2 `commands` (without the leading "ip") on `rnode` using
+    a single "ip -batch" invocation and returns its output. Like running the
+    commands one by one, a failing command doesn't stop the following ones.
+
+    Parameters:
+    -----------
+    * `rnode`: router (or any topogen gear) to run the commands on
+    * `commands`: list of commands, e.g. ["link set up dev r1-eth0"]
+    """
+
+    fname = get_file("\n".join(commands) + "\n")
+    output = rnode.run("ip -force -batch {}".format(fname))
+    os.unlink(fname)
+
+    return output
+
+
 def addKernelRoute(
     tgen, router, intf, group_addr_range, next_hop=None, src=None, del_action=None
 ):
@@ -2641,32 +2678,46 @@ def addKernelRoute(
     if type(group_addr_range) is not list:
         group_addr_range = [group_addr_range]
 
+    # Route commands for the whole range are fed to a single 'ip -batch'
+    # invocation, the kernel tables are then dumped once per family.
+    batch = []
+    verify_cmds = []
     for grp_addr in group_addr_range:
 
         addr_type = validate_ip_address(grp_addr)
         if addr_type == "ipv4":
             if next_hop is not None:
-                cmd = "ip route add {} via {}".format(grp_addr, next_hop)
+                cmd = "route add {} via {}".format(grp_addr, next_hop)
             else:
-                cmd = "ip route add {} dev {}".format(grp_addr, intf)
+                cmd = "route add {} dev {}".format(grp_addr, intf)
             if del_action:
-                cmd = "ip route del {}".format(grp_addr)
+                cmd = "route del {}".format(grp_addr)
             verify_cmd = "ip route"
         elif addr_type == "ipv6":
             if intf and src:
-                cmd = "ip -6 route add {} dev {} src {}".format(grp_addr, intf, src)
+                cmd = "route add {} dev {} src {}".format(grp_addr, intf, src)
             else:
-                cmd = "ip -6 route add {} via {}".format(grp_addr, next_hop)
+                cmd = "route add {} via {}".format(grp_addr, next_hop)
             verify_cmd = "ip -6 route"
             if del_action:
-                cmd = "ip -6 route del {}".format(grp_addr)
+                cmd = "route del {}".format(grp_addr)
 
-        logger.info("[DUT: {}]: Running command: [{}]".format(router, cmd))
-        output = rnode.run(cmd)
+        logger.info("[DUT: {}]: Running command: [ip {}]".format(router, cmd))
+        batch.append(cmd)
+        if verify_cmd not in verify_cmds:
+            verify_cmds.append(verify_cmd)
+
+    output = run_ip_batch(rnode, batch)
 
-        # Verifying if ip route added to kernal
-        result = rnode.run(verify_cmd)
-        logger.debug("{}\n{}".format(verify_cmd, result))
+    # Verifying if ip route added to kernal
+    result = ""
+    for verify_cmd in verify_cmds:
+        verify_output = rnode.run(verify_cmd)
+        logger.debug("{}\n{}".format(verify_cmd, verify_output))
+        result += verify_output
+
+    for grp_addr in group_addr_range:
+        mask = None
         if "/" in grp_addr:
             ip, mask = grp_addr.split("/")
             if mask == "32" or mask == "128":
@@ -2827,27 +2878,25 @@ def configure_brctl(tgen, topo, input_dict):
                 stp_values = brctl_dict.setdefault("stp", [])
                 vrfs = brctl_dict.setdefault("vrf", [])
 
-                ip_cmd = "ip link set"
+                ip_cmd = "link set"
                 for brctl_name, vxlan, vrf, stp in zip(
                     brctl_names, addvxlans, vrfs, stp_values
                 ):
 
-                    ip_cmd_list = []
-                    cmd = "ip link add name {} type bridge stp_state {}".format(
-                        brctl_name, stp
-                    )
+                    ip_cmd_list = [
+                        "link add name {} type bridge stp_state {}".format(
+                            brctl_name, stp
+                        )
+                    ]
 
-                    logger.info("[DUT: %s]: Running command: %s", dut, cmd)
-                    rnode.run(cmd)
+                    if vxlan:
+                        ip_cmd_list.append(
+                            "{} dev {} master {}".format(ip_cmd, vxlan, brctl_name)
+                        )
 
                     ip_cmd_list.append("{} up dev {}".format(ip_cmd, brctl_name))
 
                     if vxlan:
-                        cmd = "{} dev {} master {}".format(ip_cmd, vxlan, brctl_name)
-
-                        logger.info("[DUT: %s]: Running command: %s", dut, cmd)
-                        rnode.run(cmd)
-
                         ip_cmd_list.append("{} up dev {}".format(ip_cmd, vxlan))
 
                     if vrf:
@@ -2866,8 +2915,10 @@ def configure_brctl(tgen, topo, input_dict):
 
                     try:
                         for _ip_cmd in ip_cmd_list:
-                            logger.info("[DUT: %s]: Running command: %s", dut, _ip_cmd)
-                            rnode.run(_ip_cmd)
+                            logger.info(
+                                "[DUT: %s]: Running command: ip %s", dut, _ip_cmd
+                            )
+                        run_ip_batch(rnode, ip_cmd_list)
 
                     except InvalidCLIError:
                         # Traceback
@@ -2905,20 +2956,24 @@ def configure_interface_mac(tgen, input_dict):
     for dut in input_dict.keys():
         rnode = tgen.routers()[dut]
 
+        cmds = []
         for intf, mac in input_dict[dut].items():
             cmd = "ifconfig {} hw ether {}".format(intf, mac)
             logger.info("[DUT: %s]: Running command: %s", dut, cmd)
+            cmds.append(cmd)
 
-            try:
-                result = rnode.run(cmd)
-                if len(result) != 0:
-                    return result
-
-            except InvalidCLIError:
-                # Traceback
-                errormsg = traceback.format_exc()
-                logger.error(errormsg)
-                return errormsg
+        # Configure all interfaces of this router in a single shell call,
+        # the chain stops at (and reports) the first failing command.
+        try:
+            result = rnode.run(" && ".join(cmds))
+            if len(result) != 0:
+                return result
+
+        except InvalidCLIError:
+            # Traceback
+            errormsg = traceback.format_exc()
+            logger.error(errormsg)
+            return errormsg
 
     return True
 
@@ -3038,15 +3093,9 @@ def verify_rib(
                         return errormsg
 
                     network = static_route["network"]
-                    if "no_of_ip" in static_route:
-                        no_of_ip = static_route["no_of_ip"]
-                    else:
-                        no_of_ip = 1
+                    no_of_ip = static_route.get("no_of_ip", 1)
 
-                    if "tag" in static_route:
-                        _tag = static_route["tag"]
-                    else:
-                        _tag = None
+                    _tag = static_route.get("tag")
 
                     # Generating IPs for verification
                     ip_list = generate_ips(network, no_of_ip)
@@ -3267,10 +3316,7 @@ def verify_rib(
                     return errormsg
 
                 start_ip = advertise_network_dict["network"]
-                if "no_of_network" in advertise_network_dict:
-                    no_of_network = advertise_network_dict["no_of_network"]
-                else:
-                    no_of_network = 1
+                no_of_network = advertise_network_dict.get("no_of_network", 1)
 
                 # Generating IPs for verification
                 ip_list = generate_ips(start_ip, no_of_network)
@@ -3416,10 +3462,7 @@ def verify_fib_routes(tgen, addr_type, dut, input_dict, next_hop=None):
                         return errormsg
 
                     network = static_route["network"]
-                    if "no_of_ip" in static_route:
-                        no_of_ip = static_route["no_of_ip"]
-                    else:
-                        no_of_ip = 1
+                    no_of_ip = static_route.get("no_of_ip", 1)
 
                     # Generating IPs for verification
                     ip_list = generate_ips(network, no_of_ip)
@@ -3521,10 +3564,7 @@ def verify_fib_routes(tgen, addr_type, dut, input_dict, next_hop=None):
                     return errormsg
 
                 start_ip = advertise_network_dict["network"]
-                if "no_of_network" in advertise_network_dict:
-                    no_of_network = advertise_network_dict["no_of_network"]
-                else:
-                    no_of_network = 1
+                no_of_network = advertise_network_dict.get("no_of_network", 1)
 
                 # Generating IPs for verification
                 ip_list = generate_ips(start_ip, no_of_network)
@@ -4351,7 +4391,7 @@ def iperfSendIGMPJoin(
         # Check if iperf process is running
         if output:
             pid = output.split()[1]
-            rnode.run("touch /var/run/frr/iperf_server.pid")
+            # ">>" creates the pid file when needed
             rnode.run("echo %s >> /var/run/frr/iperf_server.pid" % pid)
         else:
             errormsg = "IGMP join is not sent for {}. Error: {}".format(bindTo, output)
@@ -4446,7 +4486,7 @@ def iperfSendTraffic(
         # Check if iperf process is running
         if output:
             pid = output.split()[1]
-            rnode.run("touch /var/run/frr/iperf_client.pid")
+            # ">>" creates the pid file when needed
             rnode.run("echo %s >> /var/run/frr/iperf_client.pid" % pid)
         else:
             errormsg = "Multicast traffic is not sent for {}. Error {}".format(
@@ -4477,23 +4517,38 @@ def kill_iperf(tgen, dut=None, action=None):
 
     logger.debug("Entering lib API: {}".format(sys._getframe().f_code.co_name))
 
-    router_list = tgen.routers()
-    for router, rnode in router_list.items():
-        # Run iperf command to send IGMP join
-        pid_client = rnode.run("cat /var/run/frr/iperf_client.pid")
-        pid_server = rnode.run("cat /var/run/frr/iperf_server.pid")
-        if action == "remove_join":
-            pids = pid_server
-        elif action == "remove_traffic":
-            pids = pid_client
-        else:
-            pids = "\n".join([pid_client, pid_server])
-        for pid in pids.split("\n"):
-            pid = pid.strip()
-            if pid.isdigit():
-                cmd = "set +m; kill -9 %s &> /dev/null" % pid
-                logger.debug("[DUT: {}]: Running command: [{}]".format(router, cmd))
-                rnode.run(cmd)
+    if action == "remove_join":
+        pid_files = "/var/run/frr/iperf_server.pid"
+    elif action == "remove_traffic":
+        pid_files = "/var/run/frr/iperf_client.pid"
+    else:
+        pid_files = "/var/run/frr/iperf_client.pid /var/run/frr/iperf_server.pid"
+
+    # Read the pid files and kill the listed pids in a single shell command,
+    # kill is only run when there are pids so its output is only errors.
+    cmd = (
+        'set +m; pids="$(cat %s 2> /dev/null)"; [ -z "$pids" ] || kill -9 $pids'
+        % pid_files
+    )
+
+    def _kill_iperf(rnode):
+        logger.debug("[DUT: {}]: Running command: [{}]".format(rnode.name, cmd))
+        output = rnode.run(cmd)
+        # The pid files are only appended to, pids of iperf processes killed
+        # earlier are expected to be gone.
+        errors = [
+            line
+            for line in output.splitlines()
+            if line.strip() and "No such process" not in line
+        ]
+        if errors:
+            logger.error(
+                "[DUT: {}]: Failed to kill iperf: {}".format(
+                    rnode.name, "\n".join(errors)
+                )
+            )
+
+    run_on_gears(_kill_iperf, tgen.routers().values())
 
     logger.debug("Exiting lib API: {}".format(sys._getframe().f_code.co_name))
 
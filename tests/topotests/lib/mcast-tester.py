@@ -21,6 +21,7 @@ for the multicast group we subscribed to.
 """
 
 import argparse
+import ctypes
 import os
 import json
 import socket
@@ -35,7 +36,7 @@ import time
 def interface_name_to_index(name):
     "Gets the interface index using its name. Returns None on failure."
     interfaces = json.loads(
-        subprocess.check_output('ip -j link show', shell=True))
+        subprocess.check_output(['ip', '-j', 'link', 'show']))
 
     for interface in interfaces:
         if interface['ifname'] == name:
@@ -55,6 +56,16 @@ def multicast_join(sock, ifindex, group, port):
     sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
 
 
+def multicast_drop_data(sock):
+    "Drops every packet received: the socket is only used for the IGMP JOIN."
+    # Single instruction classic BPF program: BPF_RET | BPF_K, return 0.
+    bpf_filter = ctypes.create_string_buffer(struct.pack("HBBI", 0x06, 0, 0, 0))
+    # struct sock_fprog: instruction count and pointer to the program.
+    fprog = struct.pack("HL", 1, ctypes.addressof(bpf_filter))
+    # SO_ATTACH_FILTER
+    sock.setsockopt(socket.SOL_SOCKET, 26, fprog)
+
+
 #
 # Main code.
 #
@@ -108,6 +119,8 @@ if args.send > 0:
     toposock.setblocking(False)
 else:
     multicast_join(msock, ifindex, args.group, port)
+    # The socket is never read, don't let the traffic fill its queue.
+    multicast_drop_data(msock)
 
 counter = 0
 while True:
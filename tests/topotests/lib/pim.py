@@ -37,6 +37,9 @@ from lib.common_config import (
 ####
 CWD = os.path.dirname(os.path.realpath(__file__))
 
+# Pattern used while verifying upstream entries in per-group loops.
+JOIN_TIMER_RE = re.compile(r"(\d{2}):(\d{2}):(\d{2})")
+
 
 def create_pim_config(tgen, topo, input_dict=None, build=False, load_config=True):
     """
@@ -123,81 +126,72 @@ def _create_pim_config(tgen, topo, input_dict, router, build=False, load_config=
 
         pim_data = input_dict[router]["pim"]
 
-        for dut in tgen.routers():
-            if "pim" not in input_dict[router]:
-                continue
+        # The RP commands only depend on input_dict[router], build them once
+        # and load them on every router instead of rebuilding them per link.
+        config_data = []
+        rp_data = pim_data["rp"]
+
+        for rp_dict in deepcopy(rp_data):
+            # ip address of RP
+            if "rp_addr" not in rp_dict and build:
+                logger.error(
+                    "Router %s: 'ip address of RP' not " "present in input_dict/JSON",
+                    router,
+                )
 
-            for destLink, data in topo[dut]["links"].items():
-                if "pim" not in data:
-                    continue
+                return False
+            rp_addr = rp_dict.setdefault("rp_addr", None)
 
-                if "rp" in pim_data:
-                    config_data = []
-                    rp_data = pim_data["rp"]
+            # Keep alive Timer
+            keep_alive_timer = rp_dict.setdefault("keep_alive_timer", None)
 
-                for rp_dict in deepcopy(rp_data):
-                    # ip address of RP
-                    if "rp_addr" not in rp_dict and build:
-                        logger.error(
-                            "Router %s: 'ip address of RP' not "
-                            "present in input_dict/JSON",
-                            router,
-                        )
+            # Group Address range to cover
+            if "group_addr_range" not in rp_dict and build:
+                logger.error(
+                    "Router %s:'Group Address range to cover'"
+                    " not present in input_dict/JSON",
+                    router,
+                )
 
-                        return False
-                    rp_addr = rp_dict.setdefault("rp_addr", None)
+                return False
+            group_addr_range = rp_dict.setdefault("group_addr_range", None)
 
-                    # Keep alive Timer
-                    keep_alive_timer = rp_dict.setdefault("keep_alive_timer", None)
+            # Group prefix-list filter
+            prefix_list = rp_dict.setdefault("prefix_list", None)
 
-                    # Group Address range to cover
-                    if "group_addr_range" not in rp_dict and build:
-                        logger.error(
-                            "Router %s:'Group Address range to cover'"
-                            " not present in input_dict/JSON",
-                            router,
-                        )
+            # Delete rp config
+            del_action = rp_dict.setdefault("delete", False)
 
-                        return False
-                    group_addr_range = rp_dict.setdefault("group_addr_range", None)
+            if keep_alive_timer:
+                cmd = "ip pim rp keep-alive-timer {}".format(keep_alive_timer)
+                config_data.append(cmd)
 
-                    # Group prefix-list filter
-                    prefix_list = rp_dict.setdefault("prefix_list", None)
+                if del_action:
+                    cmd = "no {}".format(cmd)
+                    config_data.append(cmd)
 
-                    # Delete rp config
-                    del_action = rp_dict.setdefault("delete", False)
+            if rp_addr:
+                if group_addr_range:
+                    if type(group_addr_range) is not list:
+                        group_addr_range = [group_addr_range]
 
-                    if keep_alive_timer:
-                        cmd = "ip pim rp keep-alive-timer {}".format(keep_alive_timer)
+                    for grp_addr in group_addr_range:
+                        cmd = "ip pim rp {} {}".format(rp_addr, grp_addr)
                         config_data.append(cmd)
 
                         if del_action:
                             cmd = "no {}".format(cmd)
                             config_data.append(cmd)
 
-                    if rp_addr:
-                        if group_addr_range:
-                            if type(group_addr_range) is not list:
-                                group_addr_range = [group_addr_range]
-
-                            for grp_addr in group_addr_range:
-                                cmd = "ip pim rp {} {}".format(rp_addr, grp_addr)
-                                config_data.append(cmd)
-
-                                if del_action:
-                                    cmd = "no {}".format(cmd)
-                                    config_data.append(cmd)
-
-                        if prefix_list:
-                            cmd = "ip pim rp {} prefix-list {}".format(
-                                rp_addr, prefix_list
-                            )
-                            config_data.append(cmd)
+                if prefix_list:
+                    cmd = "ip pim rp {} prefix-list {}".format(rp_addr, prefix_list)
+                    config_data.append(cmd)
 
-                            if del_action:
-                                cmd = "no {}".format(cmd)
-                                config_data.append(cmd)
+                    if del_action:
+                        cmd = "no {}".format(cmd)
+                        config_data.append(cmd)
 
+        for dut in tgen.routers():
             result = create_common_configuration(
                 tgen, dut, config_data, "pim", build, load_config
             )
@@ -416,7 +410,7 @@ def find_rp_details(tgen, topo):
                 rp_addr = rp_dict["rp_addr"]
 
                 for link, data in topo["routers"][router]["links"].items():
-                    if data["ipv4"].split("/")[0] == rp_addr:
+                    if data["ipv4"].partition("/")[0] == rp_addr:
                         rp_details[router] = rp_addr
 
     return rp_details
@@ -567,7 +561,7 @@ def verify_pim_neighbors(tgen, topo, dut=None, iface=None, nbr_ip=None, expected
             logger.info("[DUT: %s]: Verifying PIM neighbor status:", router)
 
             if "pim" in data and data["pim"] == "enable":
-                pim_nh_intf_ip = data["ipv4"].split("/")[0]
+                pim_nh_intf_ip = data["ipv4"].partition("/")[0]
 
                 # Verifying PIM neighbor
                 if local_interface in show_ip_pim_neighbor_json:
@@ -741,6 +735,113 @@ def verify_upstream_iif(
         rnode, "show ip pim upstream json", isjson=True
     )
 
+    result = _verify_upstream_iif_json(
+        dut,
+        show_ip_pim_upstream_json,
+        iif,
+        src_address,
+        group_addresses,
+        joinState,
+        refCount,
+    )
+    if result is not True:
+        return result
+
+    logger.debug("Exiting lib API: {}".format(sys._getframe().f_code.co_name))
+    return True
+
+
+@retry(retry_timeout=60)
+def verify_upstream_iif_bulk(
+    tgen, input_dict, group_addresses, joinState=None, refCount=1, expected=True
+):
+    """
+    Verify upstream inbound interface for a list of (*, G)/(S, G) entries,
+    possibly spread over several DUTs. "show ip pim upstream json" is run
+    only once per DUT and every entry for that DUT is verified against the
+    same output.
+
+    Parameters
+    ----------
+    * `tgen`: topogen object
+    * `input_dict`: list of dicts with "dut", "src_address" and "iif" keys,
+                    as passed one by one to verify_upstream_iif()
+    * `group_addresses`: IGMP group address(es) verified for every entry,
+                         as in verify_upstream_iif() only the first group
+                         of a list is checked
+    * `joinState`: upstream join state
+    * `refCount`: refCount value
+    * `expected` : expected results from API, by-default True
+
+    Usage
+    -----
+    input_dict = [
+        {"dut": "l1", "src_address": "*", "iif": "l1-r2-eth4"},
+        {"dut": "r2", "src_address": "*", "iif": "lo"},
+    ]
+    result = verify_upstream_iif_bulk(tgen, input_dict, "225.1.1.1")
+
+    Returns
+    -------
+    errormsg(str) or True
+    """
+
+    logger.debug("Entering lib API: {}".format(sys._getframe().f_code.co_name))
+
+    router_list = tgen.routers()
+    upstream_json = {}
+    for data in input_dict:
+        dut = data["dut"]
+        if dut not in router_list:
+            return False
+
+        if dut not in upstream_json:
+            logger.info(
+                "[DUT: %s]: Verifying upstream Inbound Interface"
+                " for IGMP groups received:",
+                dut,
+            )
+            upstream_json[dut] = run_frr_cmd(
+                router_list[dut], "show ip pim upstream json", isjson=True
+            )
+
+        result = _verify_upstream_iif_json(
+            dut,
+            upstream_json[dut],
+            data["iif"],
+            data["src_address"],
+            group_addresses,
+            joinState,
+            refCount,
+        )
+        if result is not True:
+            return result
+
+    logger.debug("Exiting lib API: {}".format(sys._getframe().f_code.co_name))
+    return True
+
+
+def _verify_upstream_iif_json(
+    dut,
+    show_ip_pim_upstream_json,
+    iif,
+    src_address,
+    group_addresses,
+    joinState=None,
+    refCount=1,
+):
+    """
+    Helper for verify_upstream_iif() and verify_upstream_iif_bulk():
+    verifies the upstream inbound interface of (src_address,
+    group_addresses) against an already fetched "show ip pim upstream json"
+    output. As verify_upstream_iif() always did, it returns once the first
+    group of `group_addresses` is verified.
+
+    Returns
+    -------
+    errormsg(str) or True
+    """
+
     if type(group_addresses) is not list:
         group_addresses = [group_addresses]
 
@@ -843,7 +944,6 @@ def verify_upstream_iif(
             )
             return errormsg
 
-        logger.debug("Exiting lib API: {}".format(sys._getframe().f_code.co_name))
         return True
 
 
@@ -936,7 +1036,7 @@ def verify_join_state_and_timer(tgen, dut, iif, src_address, group_addresses, ex
 
         # Verify join timer
         joinTimer = group_addr_json[src_address]["joinTimer"]
-        if not re.match(r"(\d{2}):(\d{2}):(\d{2})", joinTimer):
+        if not JOIN_TIMER_RE.match(joinTimer):
             error = (
                 "[DUT %s]: Verifying join timer for"
                 " (%s,%s) [FAILED]!! "
@@ -1011,13 +1111,97 @@ def verify_ip_mroutes(
     logger.info("[DUT: %s]: Verifying ip mroutes", dut)
     show_ip_mroute_json = run_frr_cmd(rnode, "show ip mroute json", isjson=True)
 
-    if return_uptime:
-        uptime_dict = {}
+    uptime_dict = {} if return_uptime else None
 
     if bool(show_ip_mroute_json) == False:
         error_msg = "[DUT %s]: mroutes are not present or flushed out !!" % (dut)
         return error_msg
 
+    result = _verify_ip_mroutes_json(
+        dut, show_ip_mroute_json, src_address, group_addresses, iif, oil, uptime_dict
+    )
+    if result is not True:
+        return result
+
+    logger.debug("Exiting lib API: {}".format(sys._getframe().f_code.co_name))
+    return True if return_uptime == False else uptime_dict
+
+
+@retry(retry_timeout=80)
+def verify_ip_mroutes_bulk(tgen, input_dict, group_addresses, expected=True):
+    """
+    Verify ip mroutes for a list of (*, G)/(S, G) entries, possibly spread
+    over several DUTs. "show ip mroute json" is run only once per DUT and
+    every entry for that DUT is verified against the same output.
+
+    Parameters
+    ----------
+    * `tgen`: topogen object
+    * `input_dict`: list of dicts with "dut", "src_address", "iif" and "oil"
+                    keys, as passed one by one to verify_ip_mroutes()
+    * `group_addresses`: IGMP group address(es) verified for every entry
+    * `expected` : expected results from API, by-default True
+
+    Usage
+    -----
+    input_dict = [
+        {"dut": "l1", "src_address": "*", "iif": "l1-r2-eth4", "oil": "l1-i1-eth1"},
+        {"dut": "r2", "src_address": "*", "iif": "lo", "oil": "r2-l1-eth2"},
+    ]
+    result = verify_ip_mroutes_bulk(tgen, input_dict, "225.1.1.1")
+
+    Returns
+    -------
+    errormsg(str) or True
+    """
+
+    logger.debug("Entering lib API: {}".format(sys._getframe().f_code.co_name))
+
+    router_list = tgen.routers()
+    mroute_json = {}
+    for data in input_dict:
+        dut = data["dut"]
+        if dut not in router_list:
+            return False
+
+        if dut not in mroute_json:
+            logger.info("[DUT: %s]: Verifying ip mroutes", dut)
+            mroute_json[dut] = run_frr_cmd(
+                router_list[dut], "show ip mroute json", isjson=True
+            )
+
+        if bool(mroute_json[dut]) == False:
+            error_msg = "[DUT %s]: mroutes are not present or flushed out !!" % (dut)
+            return error_msg
+
+        result = _verify_ip_mroutes_json(
+            dut,
+            mroute_json[dut],
+            data["src_address"],
+            group_addresses,
+            data["iif"],
+            data["oil"],
+        )
+        if result is not True:
+            return result
+
+    logger.debug("Exiting lib API: {}".format(sys._getframe().f_code.co_name))
+    return True
+
+
+def _verify_ip_mroutes_json(
+    dut, show_ip_mroute_json, src_address, group_addresses, iif, oil, uptime_dict=None
+):
+    """
+    Helper for verify_ip_mroutes() and verify_ip_mroutes_bulk(): verifies
+    (src_address, group_addresses) against an already fetched
+    "show ip mroute json" output. Fills `uptime_dict` when it is not None.
+
+    Returns
+    -------
+    errormsg(str) or True
+    """
+
     if not isinstance(group_addresses, list):
         group_addresses = [group_addresses]
 
@@ -1036,7 +1220,7 @@ def verify_ip_mroutes(
             )
             return errormsg
         else:
-            if return_uptime:
+            if uptime_dict is not None:
                 uptime_dict[grp_addr] = {}
 
             group_addr_json = show_ip_mroute_json[grp_addr]
@@ -1049,7 +1233,7 @@ def verify_ip_mroutes(
             )
             return errormsg
         else:
-            if return_uptime:
+            if uptime_dict is not None:
                 uptime_dict[grp_addr][src_address] = {}
 
             mroutes = group_addr_json[src_address]
@@ -1104,7 +1288,7 @@ def verify_ip_mroutes(
                             and data["inboundInterface"] in iif
                             and data["outboundInterface"] in oil
                         ):
-                            if return_uptime:
+                            if uptime_dict is not None:
 
                                 uptime_dict[grp_addr][src_address] = data["upTime"]
 
@@ -1159,8 +1343,7 @@ def verify_ip_mroutes(
             )
             return errormsg
 
-    logger.debug("Exiting lib API: {}".format(sys._getframe().f_code.co_name))
-    return True if return_uptime == False else uptime_dict
+    return True
 
 
 @retry(retry_timeout=60)
@@ -1222,7 +1405,7 @@ def verify_pim_rp_info(
                 rnode, "show ip route connected json", isjson=True
             )
             for _rp in show_ip_route_json.keys():
-                if rp == _rp.split("/")[0]:
+                if rp == _rp.partition("/")[0]:
                     iamRP = True
                     break
                 else:
@@ -1555,7 +1738,7 @@ def verify_pim_interface(tgen, topo, dut, interface=None, interface_ip=None, exp
 
                 if "pim" in data and data["pim"] == "enable":
                     pim_interface = data["interface"]
-                    pim_intf_ip = data["ipv4"].split("/")[0]
+                    pim_intf_ip = data["ipv4"].partition("/")[0]
 
                     if pim_interface in show_ip_pim_interface_json:
                         pim_intf_json = show_ip_pim_interface_json[pim_interface]
@@ -2404,7 +2587,7 @@ def verify_ip_pim_upstream_rpf(tgen, topo, dut, interface, group_addresses, rp=N
 
                     data = pim_neighbor[dut]
                     if "pim" in data and data["pim"] == "enable":
-                        pim_nh_intf_ip = data["ipv4"].split("/")[0]
+                        pim_nh_intf_ip = data["ipv4"].partition("/")[0]
 
                 upstream_rpf_json = show_ip_pim_upstream_rpf_json[grp_addr]["*"]
 
@@ -2578,7 +2761,7 @@ def verify_ip_pim_join(tgen, topo, dut, interface, group_addresses, src_address=
 
         interface_json = show_pim_join_json[interface]
 
-        grp_addr = grp_addr.split("/")[0]
+        grp_addr = grp_addr.partition("/")[0]
         for source, data in interface_json[grp_addr].items():
 
             # Verify pim join
@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+
+#
+# test_pim_bulk.py
+# Tests for library functions: verify_ip_mroutes_bulk() and
+# verify_upstream_iif_bulk().
+#
+# Permission to use, copy, modify, and/or distribute this software
+# for any purpose with or without fee is hereby granted, provided
+# that the above copyright notice and this permission notice appear
+# in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHORS DISCLAIM ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY
+# DAMAGES WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS,
+# WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS
+# ACTION, ARISING OUT OF OR IN CONNECTION WITH THE USE OR PERFORMANCE
+# OF THIS SOFTWARE.
+#
+
+"""
+Tests for the bulk PIM verification functions, compared against the per
+entry functions they replace in the multicast tests.
+"""
+
+import os
+import sys
+import pytest
+
+# Save the Current Working Directory to find lib files.
+CWD = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(CWD, "../../"))
+
+# pylint: disable=C0413
+from lib.pim import (
+    verify_ip_mroutes,
+    verify_ip_mroutes_bulk,
+    verify_upstream_iif,
+    verify_upstream_iif_bulk,
+)
+
+GROUP = "225.1.1.1"
+SOURCE = "10.0.5.2"
+
+
+def _mroute(src, iif, oil):
+    return {
+        "installed": 1,
+        "iif": iif,
+        "oil": {
+            oil: {
+                "source": src,
+                "group": GROUP,
+                "inboundInterface": iif,
+                "outboundInterface": oil,
+                "upTime": "00:00:10",
+            }
+        },
+    }
+
+
+def _upstream(iif):
+    return {"inboundInterface": iif, "joinState": "Joined", "refCount": 1}
+
+
+class FakeRouter(object):
+    "Router answering canned vtysh json outputs and counting the json calls"
+
+    def __init__(self, name, outputs):
+        self.name = name
+        self.outputs = outputs
+        self.json_calls = 0
+
+    def vtysh_cmd(self, cmd, isjson=False):
+        if not isjson:
+            return ""
+        self.json_calls += 1
+        return self.outputs[cmd]
+
+
+class FakeTopogen(object):
+    def __init__(self, routers):
+        self._routers = routers
+
+    def routers(self):
+        return self._routers
+
+
+@pytest.fixture
+def tgen():
+    l1 = FakeRouter(
+        "l1",
+        {
+            "show ip mroute json": {
+                GROUP: {
+                    "*": _mroute("*", "l1-r2-eth4", "l1-i1-eth1"),
+                    SOURCE: _mroute(SOURCE, "l1-r2-eth4", "l1-i1-eth1"),
+                }
+            },
+            "show ip pim upstream json": {
+                GROUP: {"*": _upstream("l1-r2-eth4"), SOURCE: _upstream("l1-r2-eth4")}
+            },
+        },
+    )
+    r2 = FakeRouter(
+        "r2",
+        {
+            "show ip mroute json": {GROUP: {"*": _mroute("*", "lo", "r2-l1-eth2")}},
+            "show ip pim upstream json": {GROUP: {"*": _upstream("lo")}},
+        },
+    )
+    return FakeTopogen({"l1": l1, "r2": r2})
+
+
+INPUT_DICT = [
+    {"dut": "l1", "src_address": "*", "iif": "l1-r2-eth4", "oil": "l1-i1-eth1"},
+    {"dut": "l1", "src_address": SOURCE, "iif": "l1-r2-eth4", "oil": "l1-i1-eth1"},
+    {"dut": "r2", "src_address": "*", "iif": "lo", "oil": "r2-l1-eth2"},
+]
+
+
+def test_mroutes_bulk_matches_per_entry(tgen):
+    "Test verify_ip_mroutes_bulk() agrees with verify_ip_mroutes() per entry"
+    for data in INPUT_DICT:
+        result = verify_ip_mroutes(
+            tgen, data["dut"], data["src_address"], GROUP, data["iif"], data["oil"]
+        )
+        assert result is True
+
+    assert verify_ip_mroutes_bulk(tgen, INPUT_DICT, GROUP) is True
+
+
+def test_mroutes_bulk_fetches_once_per_dut(tgen):
+    "Test verify_ip_mroutes_bulk() runs the json show once per DUT"
+    assert verify_ip_mroutes_bulk(tgen, INPUT_DICT, GROUP) is True
+    assert tgen.routers()["l1"].json_calls == 1
+    assert tgen.routers()["r2"].json_calls == 1
+
+
+def test_mroutes_bulk_reports_failing_entry(tgen):
+    "Test verify_ip_mroutes_bulk() fails when any entry does not match"
+    input_dict = INPUT_DICT + [
+        {"dut": "r2", "src_address": SOURCE, "iif": "r2-f1-eth0", "oil": "r2-l1-eth2"}
+    ]
+    # Call the undecorated function, a failing retry collects a support bundle.
+    result = verify_ip_mroutes_bulk._original(tgen, input_dict, GROUP)
+    assert result is not True
+    assert "r2" in result and SOURCE in result
+
+    result = verify_ip_mroutes_bulk._original(tgen, [{"dut": "r9"}], GROUP)
+    assert result is False
+
+
+def test_upstream_iif_bulk_matches_per_entry(tgen):
+    "Test verify_upstream_iif_bulk() agrees with verify_upstream_iif() per entry"
+    for data in INPUT_DICT:
+        result = verify_upstream_iif(
+            tgen, data["dut"], data["iif"], data["src_address"], GROUP
+        )
+        assert result is True
+
+    assert verify_upstream_iif_bulk(tgen, INPUT_DICT, GROUP) is True
+
+
+def test_upstream_iif_bulk_fetches_once_per_dut(tgen):
+    "Test verify_upstream_iif_bulk() runs the json show once per DUT"
+    assert verify_upstream_iif_bulk(tgen, INPUT_DICT, GROUP) is True
+    assert tgen.routers()["l1"].json_calls == 1
+    assert tgen.routers()["r2"].json_calls == 1
+
+
+def test_upstream_iif_bulk_reports_failing_entry(tgen):
+    "Test verify_upstream_iif_bulk() fails when any entry does not match"
+    input_dict = INPUT_DICT + [{"dut": "r2", "src_address": "*", "iif": "r2-f1-eth0"}]
+    # Call the undecorated function, a failing retry collects a support bundle.
+    result = verify_upstream_iif_bulk._original(tgen, input_dict, GROUP)
+    assert result is not True
+    assert "r2" in result
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+
+#
+# test_run_on_gears.py
+# Tests for library function: run_on_gears().
+#
+# Permission to use, copy, modify, and/or distribute this software
+# for any purpose with or without fee is hereby granted, provided
+# that the above copyright notice and this permission notice appear
+# in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHORS DISCLAIM ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY
+# DAMAGES WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS,
+# WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS
+# ACTION, ARISING OUT OF OR IN CONNECTION WITH THE USE OR PERFORMANCE
+# OF THIS SOFTWARE.
+#
+
+"""
+Tests for the run_on_gears() function and its use in stop_topology().
+"""
+
+import os
+import sys
+import threading
+import time
+import pytest
+
+# Save the Current Working Directory to find lib files.
+CWD = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(CWD, "../../"))
+
+# pylint: disable=C0413
+from lib.topogen import Topogen, run_on_gears
+
+
+class GearOutcome(BaseException):
+    "BaseException subclass, like the pytest outcomes."
+
+
+def test_results_keep_gear_order():
+    "Test results are returned in gear order, not completion order"
+
+    def _slow_first(gear):
+        # The first gears finish last.
+        time.sleep(0.01 * (5 - gear))
+        return gear * 10
+
+    assert run_on_gears(_slow_first, range(5)) == [0, 10, 20, 30, 40]
+    assert run_on_gears(_slow_first, range(5), max_workers=1) == [0, 10, 20, 30, 40]
+    assert run_on_gears(_slow_first, []) == []
+
+
+def test_first_error_is_reraised():
+    "Test an exception raised in a worker thread reaches the caller"
+
+    def _fail_on_two(gear):
+        if gear == 2:
+            raise ValueError("gear 2 failed")
+        return gear
+
+    with pytest.raises(ValueError, match="gear 2 failed"):
+        run_on_gears(_fail_on_two, range(5))
+
+    with pytest.raises(ValueError, match="gear 2 failed"):
+        run_on_gears(_fail_on_two, range(5), max_workers=1)
+
+
+def test_base_exception_is_reraised():
+    "Test BaseException subclasses raised in a worker reach the caller"
+
+    def _outcome(gear):
+        raise GearOutcome("gear {}".format(gear))
+
+    with pytest.raises(GearOutcome):
+        run_on_gears(_outcome, range(3))
+
+
+def test_worker_count_is_bounded():
+    "Test no more than max_workers calls run at the same time"
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0}
+
+    def _track(gear):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        time.sleep(0.01)
+        with lock:
+            state["running"] -= 1
+        return gear
+
+    assert run_on_gears(_track, range(10), max_workers=3) == list(range(10))
+    assert 1 <= state["peak"] <= 3
+
+
+def test_stop_topology_ignores_none_results():
+    "Test stop_topology() accepts gears whose stop() returns None"
+
+    class FakeGear(object):
+        def __init__(self, result):
+            self.result = result
+
+        def stop(self):
+            return self.result
+
+    class FakeNet(object):
+        stopped = False
+
+        def stop(self):
+            self.stopped = True
+
+    class FakeTopogen(object):
+        modname = "test_run_on_gears"
+
+    tgen = FakeTopogen()
+    tgen.gears = {"r1": FakeGear(None), "r2": FakeGear(""), "r3": FakeGear(None)}
+    tgen.net = FakeNet()
+
+    # Call the plain function, FakeTopogen is not a Topogen instance.
+    Topogen.__dict__["stop_topology"](tgen)
+    assert tgen.net.stopped
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main())
@@ -46,14 +46,17 @@ import json
 
 if sys.version_info[0] > 2:
     import configparser
+    from shutil import which
 else:
     import ConfigParser as configparser
+    from distutils.spawn import find_executable as which
 
 import glob
 import grp
 import platform
 import pwd
 import subprocess
+import threading
 import pytest
 
 from mininet.net import Mininet
@@ -89,6 +92,57 @@ def set_topogen(tgen):
     global_tgen = tgen
 
 
+# Maximum number of gears run_on_gears() handles at the same time.
+RUN_ON_GEARS_MAX_WORKERS = 8
+
+
+def run_on_gears(func, gears, max_workers=RUN_ON_GEARS_MAX_WORKERS):
+    """
+    Helper function to call `func` for each gear in `gears` using up to
+    `max_workers` threads. Returns the list of results in the same order as
+    `gears`, the first exception raised by a call (including BaseException
+    subclasses such as pytest outcomes or KeyboardInterrupt) is re-raised
+    once all threads finished. With `max_workers` set to 1 the calls are made
+    one after the other from the calling thread.
+    """
+    gears = list(gears)
+    results = [None] * len(gears)
+
+    if max_workers <= 1:
+        for idx, gear in enumerate(gears):
+            results[idx] = func(gear)
+        return results
+
+    errors = []
+    pending = list(enumerate(gears))
+    lock = threading.Lock()
+
+    def _run():
+        while True:
+            with lock:
+                if errors or not pending:
+                    return
+                idx, gear = pending.pop(0)
+            try:
+                results[idx] = func(gear)
+            # pylint: disable=W0703
+            except BaseException as error:
+                with lock:
+                    errors.append(error)
+
+    threads = [
+        threading.Thread(target=_run) for _ in range(min(max_workers, len(gears)))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+    return results
+
+
 #
 # Main class: topology builder
 #
@@ -122,6 +176,8 @@ class Topogen(object):
         self.modname = modname
         self.errorsd = {}
         self.errors = ""
+        # set_error() may be called from run_on_gears() worker threads.
+        self.errors_lock = threading.Lock()
         self.peern = 1
         self._init_topo(cls)
         logger.info("loading topology: {}".format(self.modname))
@@ -177,7 +233,7 @@ class Topogen(object):
         Returns a TopoRouter.
         """
         if name is None:
-            name = "r{}".format(self.routern)
+            name = "r%d" % self.routern
         if name in self.gears:
             raise KeyError("router already exists")
 
@@ -198,7 +254,7 @@ class Topogen(object):
         Returns the switch name and number.
         """
         if name is None:
-            name = "s{}".format(self.switchn)
+            name = "s%d" % self.switchn
         if name in self.gears:
             raise KeyError("switch already exists")
 
@@ -214,7 +270,7 @@ class Topogen(object):
         * `defaultRoute`: the peer default route (e.g. 'via 1.2.3.1')
         """
         if name is None:
-            name = "peer{}".format(self.peern)
+            name = "peer%d" % self.peern
         if name in self.gears:
             raise KeyError("exabgp peer already exists")
 
@@ -230,7 +286,7 @@ class Topogen(object):
         * `defaultRoute`: the peer default route (e.g. 'via 1.2.3.1')
         """
         if name is None:
-            name = "host{}".format(self.peern)
+            name = "host%d" % self.peern
         if name in self.gears:
             raise KeyError("host already exists")
 
@@ -330,9 +386,20 @@ class Topogen(object):
         If no router is specified it is called for all registred routers.
         """
         if router is None:
-            # pylint: disable=r1704
-            for _, router in self.routers().items():
-                router.start()
+            # Every router runs its commands through its own shell, so they
+            # can be brought up concurrently instead of one after the other.
+            # Options opening windows (shell, vtysh, gdb) can't be interleaved,
+            # start the routers one at a time when any of them is used.
+            extra_config = topotest.g_extra_config
+            interactive = any(
+                extra_config.get(option)
+                for option in ("shell", "vtysh", "gdb_routers", "gdb_daemons")
+            )
+            run_on_gears(
+                lambda rnode: rnode.start(),
+                self.routers().values(),
+                max_workers=1 if interactive else RUN_ON_GEARS_MAX_WORKERS,
+            )
         else:
             if isinstance(router, str):
                 router = self.gears[router]
@@ -348,9 +415,13 @@ class Topogen(object):
         killed and try with a different signal.
         """
         logger.info("stopping topology: {}".format(self.modname))
-        errors = ""
-        for gear in self.gears.values():
-            errors += gear.stop()
+        # Gears are independent, stop them (and wait for their daemons to
+        # exit) concurrently.
+        # stop() returns None when there is nothing to report.
+        errors = "".join(
+            result or ""
+            for result in run_on_gears(lambda gear: gear.stop(), self.gears.values())
+        )
         if len(errors) > 0:
             logger.error(
                 "Errors found post shutdown - details follow: {}".format(errors)
@@ -400,12 +471,13 @@ class Topogen(object):
         "Sets an error message and signal other tests to skip."
         logger.info(message)
 
-        # If no code is defined use a sequential number
-        if code is None:
-            code = len(self.errorsd)
+        with self.errors_lock:
+            # If no code is defined use a sequential number
+            if code is None:
+                code = len(self.errorsd)
 
-        self.errorsd[code] = message
-        self.errors += "\n{}: {}".format(code, message)
+            self.errorsd[code] = message
+            self.errors += "\n{}: {}".format(code, message)
 
     def has_errors(self):
         "Returns whether errors exist or not."
@@ -438,10 +510,15 @@ class Topogen(object):
 class TopoGear(object):
     "Abstract class for type checking"
 
+    # Gears are created for every node of the topology, don't give each of
+    # them a __dict__.
+    __slots__ = ("tgen", "name", "cls", "net", "links", "linkn")
+
     def __init__(self):
         self.tgen = None
         self.name = None
         self.cls = None
+        self.net = None
         self.links = {}
         self.linkn = 0
 
@@ -486,7 +563,7 @@ class TopoGear(object):
         myif: this node interface name
         enabled: whether we should enable or disable the interface
         """
-        if myif not in self.links.keys():
+        if myif not in self.links:
             raise KeyError("interface doesn't exists")
 
         if enabled is True:
@@ -513,7 +590,7 @@ class TopoGear(object):
         NOTE: this is used to simulate a link down on this node, since when the
         peer disables their interface our interface status changes to no link.
         """
-        if myif not in self.links.keys():
+        if myif not in self.links:
             raise KeyError("interface doesn't exists")
 
         node, nodeif = self.links[myif]
@@ -525,7 +602,7 @@ class TopoGear(object):
 
         NOTE: This function should only be called by Topogen.
         """
-        ifname = "{}-eth{}".format(self.name, self.linkn)
+        ifname = "%s-eth%d" % (self.name, self.linkn)
         self.linkn += 1
         return ifname
 
@@ -535,7 +612,7 @@ class TopoGear(object):
 
         NOTE: This function should only be called by Topogen.
         """
-        if myif in self.links.keys():
+        if myif in self.links:
             raise KeyError("interface already exists")
 
         self.links[myif] = (node, nodeif)
@@ -546,6 +623,8 @@ class TopoRouter(TopoGear):
     Router abstraction.
     """
 
+    __slots__ = ("options", "routertype", "logdir", "logger")
+
     # The default required directories by FRR
     PRIVATE_DIRS = [
         "/etc/frr",
@@ -609,8 +688,7 @@ class TopoRouter(TopoGear):
         self.cls = cls
         self.options = {}
         self.routertype = params.get("routertype", "frr")
-        if "privateDirs" not in params:
-            params["privateDirs"] = self.PRIVATE_DIRS
+        params.setdefault("privateDirs", self.PRIVATE_DIRS)
 
         self.options["memleak_path"] = params.get("memleak_path", None)
 
@@ -793,9 +871,7 @@ class TopoRouter(TopoGear):
         vtysh_command = 'vtysh {} -c "{}" 2>/dev/null'.format(dparam, command)
 
         output = self.run(vtysh_command)
-        self.logger.info(
-            "\nvtysh command => {}\nvtysh output <= {}".format(command, output)
-        )
+        self.logger.info("\nvtysh command => %s\nvtysh output <= %s", command, output)
         if isjson is False:
             return output
 
@@ -831,7 +907,7 @@ class TopoRouter(TopoGear):
         os.unlink(fname)
 
         self.logger.info(
-            '\nvtysh command => "{}"\nvtysh output <= "{}"'.format(vtysh_command, res)
+            '\nvtysh command => "%s"\nvtysh output <= "%s"', vtysh_command, res
         )
 
         return res
@@ -905,6 +981,7 @@ class TopoSwitch(TopoGear):
     """
 
     # pylint: disable=too-few-public-methods
+    __slots__ = ()
 
     def __init__(self, tgen, cls, name):
         super(TopoSwitch, self).__init__()
@@ -923,6 +1000,7 @@ class TopoSwitch(TopoGear):
 class TopoHost(TopoGear):
     "Host abstraction."
     # pylint: disable=too-few-public-methods
+    __slots__ = ("options",)
 
     def __init__(self, tgen, name, **params):
         """
@@ -953,6 +1031,7 @@ class TopoHost(TopoGear):
 class TopoExaBGP(TopoHost):
     "ExaBGP peer abstraction."
     # pylint: disable=too-few-public-methods
+    __slots__ = ()
 
     PRIVATE_DIRS = [
         "/etc/exabgp",
@@ -1046,17 +1125,17 @@ def diagnose_env_linux():
         ret = False
 
     # Assert that we have mininet
-    if os.system("which mn >/dev/null 2>/dev/null") != 0:
+    if which("mn") is None:
         logger.error("could not find mininet binary (mininet is not installed)")
         ret = False
 
     # Assert that we have iproute installed
-    if os.system("which ip >/dev/null 2>/dev/null") != 0:
+    if which("ip") is None:
         logger.error("could not find ip binary (iproute is not installed)")
         ret = False
 
     # Assert that we have gdb installed
-    if os.system("which gdb >/dev/null 2>/dev/null") != 0:
+    if which("gdb") is None:
         logger.error("could not find gdb binary (gdb is not installed)")
         ret = False
 
@@ -54,6 +54,14 @@ from mininet.term import makeTerm
 
 g_extra_config = {}
 
+# Patterns used while parsing command output in per-line/per-call loops.
+VERSION_RE = re.compile(r"(?P<whole>\d+(\.(\d+))*)")
+SYSCTL_RE = re.compile(r"([^ ]+) = ([^\s]+)")
+IP6_IFACE_RE = re.compile("[0-9]+: ([^:@]+)[-@a-z0-9:]+ <")
+IP6_LINKLOCAL_RE = re.compile(
+    "inet6 (fe80::[0-9a-f]+:[0-9a-f]+:[0-9a-f]+:[0-9a-f]+)[/0-9]* scope link"
+)
+
 
 def gdb_core(obj, daemon, corefiles):
     gdbcmds = """
@@ -88,6 +96,8 @@ def gdb_core(obj, daemon, corefiles):
 class json_cmp_result(object):
     "json_cmp result class for better assertion messages"
 
+    __slots__ = ("errors",)
+
     def __init__(self):
         self.errors = []
 
@@ -593,9 +603,8 @@ def version_cmp(v1, v2):
 
     Raises `ValueError` if versions are not well formated.
     """
-    vregex = r"(?P<whole>\d+(\.(\d+))*)"
-    v1m = re.match(vregex, v1)
-    v2m = re.match(vregex, v2)
+    v1m = VERSION_RE.match(v1)
+    v2m = VERSION_RE.match(v2)
     if v1m is None or v2m is None:
         raise ValueError("got a invalid version string")
 
@@ -640,20 +649,25 @@ def version_cmp(v1, v2):
 
 
 def interface_set_status(node, ifacename, ifaceaction=False, vrf_name=None):
+    """
+    Shuts `ifacename` down, or brings it up when `ifaceaction` is True.
+    `ifacename` may also be a list of interface names, they are then all
+    configured with a single vtysh invocation. vtysh stops at the first
+    failing command, the interfaces after it are then left untouched.
+    """
     if ifaceaction:
         str_ifaceaction = "no shutdown"
     else:
         str_ifaceaction = "shutdown"
-    if vrf_name == None:
-        cmd = 'vtysh -c "configure terminal" -c "interface {0}" -c "{1}"'.format(
-            ifacename, str_ifaceaction
-        )
-    else:
-        cmd = (
-            'vtysh -c "configure terminal" -c "interface {0} vrf {1}" -c "{2}"'.format(
-                ifacename, vrf_name, str_ifaceaction
-            )
-        )
+    if not isinstance(ifacename, list):
+        ifacename = [ifacename]
+    cmd = 'vtysh -c "configure terminal"'
+    for name in ifacename:
+        if vrf_name == None:
+            cmd += ' -c "interface {0}"'.format(name)
+        else:
+            cmd += ' -c "interface {0} vrf {1}"'.format(name, vrf_name)
+        cmd += ' -c "{0}"'.format(str_ifaceaction)
     node.run(cmd)
 
 
@@ -1072,7 +1086,7 @@ def set_sysctl(node, sysctl, value):
     command = "sysctl {0}={1}".format(sysctl, valuestr)
     cmdret = node.cmd(command)
 
-    matches = re.search(r"([^ ]+) = ([^\s]+)", cmdret)
+    matches = SYSCTL_RE.search(cmdret)
     if matches is None:
         return cmdret
     if matches.group(1) != sysctl:
@@ -1155,7 +1169,8 @@ class Router(Node):
         self.ns_cmd = "sudo nsenter -m -n -t {} ".format(self.pid)
         try:
             # Allow escaping from running inside docker
-            cgroup = open("/proc/1/cgroup").read()
+            with open("/proc/1/cgroup") as cgroup_file:
+                cgroup = cgroup_file.read()
             m = re.search("[0-9]+:cpuset:/docker/([a-f0-9]+)", cgroup)
             if m:
                 self.ns_cmd = "docker exec -it {} ".format(m.group(1)) + self.ns_cmd
@@ -1325,22 +1340,21 @@ class Router(Node):
 
     def loadConf(self, daemon, source=None, param=None):
         # print "Daemons before:", self.daemons
-        if daemon in self.daemons.keys():
+        if daemon in self.daemons:
             self.daemons[daemon] = 1
             if param is not None:
                 self.daemons_options[daemon] = param
             if source is None:
-                self.cmd("touch /etc/%s/%s.conf" % (self.routertype, daemon))
-                self.waitOutput()
+                setup = ["touch /etc/%s/%s.conf" % (self.routertype, daemon)]
             else:
-                self.cmd("cp %s /etc/%s/%s.conf" % (source, self.routertype, daemon))
-                self.waitOutput()
-            self.cmd("chmod 640 /etc/%s/%s.conf" % (self.routertype, daemon))
-            self.waitOutput()
-            self.cmd(
+                setup = ["cp %s /etc/%s/%s.conf" % (source, self.routertype, daemon)]
+            setup.append("chmod 640 /etc/%s/%s.conf" % (self.routertype, daemon))
+            setup.append(
                 "chown %s:%s /etc/%s/%s.conf"
                 % (self.routertype, self.routertype, self.routertype, daemon)
             )
+            # Install the file and fix its permissions in a single shell call
+            self.cmd(" && ".join(setup))
             self.waitOutput()
             if (daemon == "snmpd") and (self.routertype == "frr"):
                 self.cmd('echo "agentXSocket /etc/frr/agentx" > /etc/snmp/frr.conf')
@@ -1358,18 +1372,20 @@ class Router(Node):
     # Run a command in a new window (gnome-terminal, screen, tmux, xterm)
     def runInWindow(self, cmd, title=None):
         topo_terminal = os.getenv("FRR_TOPO_TERMINAL")
-        if topo_terminal or ("TMUX" not in os.environ and "STY" not in os.environ):
+        tmux = os.getenv("TMUX")
+        screen = os.getenv("STY")
+        if topo_terminal or (tmux is None and screen is None):
             term = topo_terminal if topo_terminal else "xterm"
             makeTerm(self, title=title if title else cmd, term=term, cmd=cmd)
         else:
             nscmd = self.ns_cmd + cmd
-            if "TMUX" in os.environ:
+            if tmux is not None:
                 self.cmd("tmux select-layout main-horizontal")
                 wcmd = "tmux split-window -h"
                 cmd = "{} {}".format(wcmd, nscmd)
-            elif "STY" in os.environ:
+            elif screen is not None:
                 if os.path.exists(
-                    "/run/screen/S-{}/{}".format(os.environ["USER"], os.environ["STY"])
+                    "/run/screen/S-{}/{}".format(os.environ["USER"], screen)
                 ):
                     wcmd = "screen"
                 else:
@@ -1382,9 +1398,7 @@ class Router(Node):
         self.cmd(
             'echo "no service integrated-vtysh-config" >> /etc/%s/vtysh.conf'
             % self.routertype
-        )
-        self.cmd(
-            "chown %s:%svty /etc/%s/vtysh.conf"
+            + " && chown %s:%svty /etc/%s/vtysh.conf"
             % (self.routertype, self.routertype, self.routertype)
         )
         # TODO remove the following lines after all tests are migrated to Topogen.
@@ -1475,7 +1489,7 @@ class Router(Node):
 
         if os.path.exists("/etc/frr/support_bundle_commands.conf"):
             bundle_data = subprocess.check_output(
-                ["cat /etc/frr/support_bundle_commands.conf"], shell=True
+                ["cat", "/etc/frr/support_bundle_commands.conf"]
             )
         self.cmd(
             "echo '{}' > /etc/frr/support_bundle_commands.conf".format(bundle_data)
@@ -1483,9 +1497,11 @@ class Router(Node):
 
         # Starts actual daemons without init (ie restart)
         # cd to per node directory
-        self.cmd("install -d {}/{}".format(self.logdir, self.name))
-        self.cmd("cd {}/{}".format(self.logdir, self.name))
-        self.cmd("umask 000")
+        self.cmd(
+            "install -d {0}/{1} && cd {0}/{1} && umask 000".format(
+                self.logdir, self.name
+            )
+        )
 
         # Re-enable to allow for report per run
         self.reportCores = True
@@ -1760,14 +1776,17 @@ class Router(Node):
                     if os.path.isfile(
                         "{}/{}/{}.log".format(self.logdir, self.name, daemon)
                     ):
-                        log_tail = subprocess.check_output(
-                            [
-                                "tail -n20 {}/{}/{}.log 2> /dev/null".format(
-                                    self.logdir, self.name, daemon
-                                )
-                            ],
-                            shell=True,
-                        )
+                        with open(os.devnull, "w") as devnull:
+                            log_tail = subprocess.check_output(
+                                [
+                                    "tail",
+                                    "-n20",
+                                    "{}/{}/{}.log".format(
+                                        self.logdir, self.name, daemon
+                                    ),
+                                ],
+                                stderr=devnull,
+                            )
                         sys.stderr.write(
                             "\nFrom %s %s %s log file:\n"
                             % (self.routertype, self.name, daemon)
@@ -1835,14 +1854,11 @@ class Router(Node):
         interface = ""
         ll_per_if_count = 0
         for line in ifaces:
-            m = re.search("[0-9]+: ([^:@]+)[-@a-z0-9:]+ <", line)
+            m = IP6_IFACE_RE.search(line)
             if m:
                 interface = m.group(1)
                 ll_per_if_count = 0
-            m = re.search(
-                "inet6 (fe80::[0-9a-f]+:[0-9a-f]+:[0-9a-f]+:[0-9a-f]+)[/0-9]* scope link",
-                line,
-            )
+            m = IP6_LINKLOCAL_RE.search(line)
             if m:
                 local = m.group(1)
                 ll_per_if_count += 1
@@ -94,8 +94,9 @@ from lib.pim import (
     create_igmp_config,
     verify_igmp_groups,
     verify_ip_mroutes,
+    verify_ip_mroutes_bulk,
     verify_pim_interface_traffic,
-    verify_upstream_iif,
+    verify_upstream_iif_bulk,
     verify_pim_neighbors,
     verify_pim_state,
     verify_ip_pim_join,
@@ -262,16 +263,12 @@ def config_to_send_igmp_join_and_traffic(
     * `traffic`: multicast traffic, default False
     """
 
-    if join:
-        # Add route to kernal
+    if join or traffic:
+        # Add route to kernal, once even if both join and traffic are set
         result = addKernelRoute(tgen, iperf, iperf_intf, GROUP_RANGE)
         assert result is True, "Testcase {}: Failed Error: {}".format(tc_name, result)
 
     if traffic:
-        # Add route to kernal
-        result = addKernelRoute(tgen, iperf, iperf_intf, GROUP_RANGE)
-        assert result is True, "Testcase {}: Failed Error: {}".format(tc_name, result)
-
         router_list = tgen.routers()
         for router in router_list.keys():
             if router == iperf:
@@ -349,8 +346,9 @@ def test_multicast_data_traffic_static_RP_send_join_then_traffic_p0(request):
     state_before = verify_pim_interface_traffic(tgen, state_dict)
     assert isinstance(
         state_before, dict
-    ), "Testcase {} : Failed \n state_before is not dictionary \n "
-    "Error: {}".format(tc_name, result)
+    ), "Testcase {} : Failed \n state_before is not dictionary \n Error: {}".format(
+        tc_name, result
+    )
 
     result = iperfSendIGMPJoin(tgen, "i1", IGMP_JOIN, join_interval=1)
     assert result is True, "Testcase {}: Failed Error: {}".format(tc_name, result)
@@ -407,27 +405,22 @@ def test_multicast_data_traffic_static_RP_send_join_then_traffic_p0(request):
         {"dut": "f1", "src_address": source, "iif": intf_f1_i2, "oil": intf_f1_r2},
     ]
 
-    for data in input_dict:
-        result = verify_ip_mroutes(
-            tgen, data["dut"], data["src_address"], IGMP_JOIN, data["iif"], data["oil"]
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict, IGMP_JOIN)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step(
         "Verify 'show ip pim upstream' showing correct OIL and IIF" " on all the nodes"
     )
-    for data in input_dict:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict, IGMP_JOIN)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("joinRx value after join sent")
     state_after = verify_pim_interface_traffic(tgen, state_dict)
     assert isinstance(
         state_after, dict
-    ), "Testcase {} : Failed \n state_before is not dictionary \n "
-    "Error: {}".format(tc_name, result)
+    ), "Testcase {} : Failed \n state_after is not dictionary \n Error: {}".format(
+        tc_name, result
+    )
 
     step(
         "l1 sent PIM (*,G) join to r2 verify using"
@@ -507,8 +500,9 @@ def test_multicast_data_traffic_static_RP_send_traffic_then_join_p0(request):
     state_before = verify_pim_interface_traffic(tgen, state_dict)
     assert isinstance(
         state_before, dict
-    ), "Testcase {} : Failed \n state_before is not dictionary \n "
-    "Error: {}".format(tc_name, result)
+    ), "Testcase {} : Failed \n state_before is not dictionary \n Error: {}".format(
+        tc_name, result
+    )
 
     result = iperfSendIGMPJoin(tgen, "i1", IGMP_JOIN, join_interval=1)
     assert result is True, "Testcase {}: Failed Error: {}".format(tc_name, result)
@@ -530,28 +524,22 @@ def test_multicast_data_traffic_static_RP_send_traffic_then_join_p0(request):
     # seconds for success on the 2nd entry in the above table. Using 100s here restores
     # previous 80 retries with 2s wait if we assume .5s per vtysh/show ip mroute runtime
     # (41 * (2 + .5)) == 102.
-    for data in input_dict:
-        result = verify_ip_mroutes(
-            tgen, data["dut"], data["src_address"], IGMP_JOIN, data["iif"], data["oil"],
-            retry_timeout=102
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict, IGMP_JOIN, retry_timeout=102)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step(
         "Verify 'show ip pim upstream' showing correct OIL and IIF" " on all the nodes"
     )
-    for data in input_dict:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict, IGMP_JOIN)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("joinRx value after join sent")
     state_after = verify_pim_interface_traffic(tgen, state_dict)
     assert isinstance(
         state_after, dict
-    ), "Testcase {} : Failed \n state_before is not dictionary \n "
-    "Error: {}".format(tc_name, result)
+    ), "Testcase {} : Failed \n state_after is not dictionary \n Error: {}".format(
+        tc_name, result
+    )
 
     step(
         "l1 sent PIM (*,G) join to r2 verify using"
@@ -644,20 +632,14 @@ def test_clear_pim_neighbors_and_mroute_p0(request):
         {"dut": "l1", "src_address": "*", "iif": "l1-c1-eth0", "oil": "l1-i1-eth1"}
     ]
 
-    for data in input_dict:
-        result = verify_ip_mroutes(
-            tgen, data["dut"], data["src_address"], IGMP_JOIN, data["iif"], data["oil"]
-        )
-        assert result is True, "Testcase{} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict, IGMP_JOIN)
+    assert result is True, "Testcase{} : Failed Error: {}".format(tc_name, result)
 
     step(
         "Verify 'show ip pim upstream' showing correct OIL and IIF" " on all the nodes"
     )
-    for data in input_dict:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN
-        )
-        assert result is True, "Testcase{} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict, IGMP_JOIN)
+    assert result is True, "Testcase{} : Failed Error: {}".format(tc_name, result)
 
     write_test_footer(tc_name)
 
@@ -748,11 +730,8 @@ def test_verify_mroute_when_same_receiver_in_FHR_LHR_and_RP_p0(request):
         {"dut": "f1", "src_address": "*", "iif": "f1-r2-eth3", "oil": "f1-i8-eth2"},
         {"dut": "f1", "src_address": source, "iif": "f1-i2-eth1", "oil": "f1-i8-eth2"},
     ]
-    for data in input_dict:
-        result = verify_ip_mroutes(
-            tgen, data["dut"], data["src_address"], IGMP_JOIN, data["iif"], data["oil"]
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict, IGMP_JOIN)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     write_test_footer(tc_name)
 
@@ -907,16 +886,8 @@ def test_verify_mroute_when_same_receiver_joining_5_diff_sources_p0(request):
             "oil": "f1-i8-eth2",
         },
     ]
-    for data in input_dict:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_2,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict, IGMP_JOIN_RANGE_2)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Stop the source one by one on FRR1")
     input_intf = {"i6": "i6-l1-eth0", "i7": "i7-l1-eth0"}
@@ -990,16 +961,8 @@ def test_verify_mroute_when_same_receiver_joining_5_diff_sources_p0(request):
             "oil": "f1-i8-eth2",
         },
     ]
-    for data in input_dict:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_2,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict, IGMP_JOIN_RANGE_2)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Start all the source again for all the receivers")
     input_intf = {"i6": "i6-l1-eth0", "i7": "i7-l1-eth0"}
@@ -1063,16 +1026,8 @@ def test_verify_mroute_when_same_receiver_joining_5_diff_sources_p0(request):
             "oil": "f1-i8-eth2",
         },
     ]
-    for data in input_dict:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_2,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict, IGMP_JOIN_RANGE_2)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     write_test_footer(tc_name)
 
@@ -1150,11 +1105,8 @@ def test_verify_mroute_when_frr_is_transit_router_p2(request):
         {"dut": "c2", "src_address": "*", "iif": "lo", "oil": "c2-c1-eth0"},
         {"dut": "c2", "src_address": source, "iif": "c2-f1-eth1", "oil": "c2-c1-eth0"},
     ]
-    for data in input_dict:
-        result = verify_ip_mroutes(
-            tgen, data["dut"], data["src_address"], IGMP_JOIN, data["iif"], data["oil"]
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict, IGMP_JOIN)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Stop multicast traffic from FRR3")
     dut = "i2"
@@ -1266,11 +1218,8 @@ def test_verify_mroute_when_RP_unreachable_p1(request):
         {"dut": "f1", "src_address": "*", "iif": "f1-r2-eth3", "oil": "f1-i8-eth2"},
         {"dut": "f1", "src_address": source, "iif": "f1-i2-eth1", "oil": "f1-i8-eth2"},
     ]
-    for data in input_dict:
-        result = verify_ip_mroutes(
-            tgen, data["dut"], data["src_address"], IGMP_JOIN, data["iif"], data["oil"]
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict, IGMP_JOIN)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Shut the RP connected interface from f1 ( r2 to f1) link")
     dut = "f1"
@@ -1375,20 +1324,14 @@ def test_modify_igmp_query_timer_p0(request):
         {"dut": "l1", "src_address": source, "iif": "l1-r2-eth4", "oil": "l1-i1-eth1"},
         {"dut": "f1", "src_address": source, "iif": "f1-i2-eth1", "oil": "f1-r2-eth3"},
     ]
-    for data in input_dict_4:
-        result = verify_ip_mroutes(
-            tgen, data["dut"], data["src_address"], IGMP_JOIN, data["iif"], data["oil"]
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_4, IGMP_JOIN)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step(
         "Verify 'show ip pim upstream' showing correct OIL and IIF" " on all the nodes"
     )
-    for data in input_dict_4:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_4, IGMP_JOIN)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Modify IGMP query interval default to other timer on FRR1" "3 times")
     input_dict_1 = {
@@ -1534,20 +1477,14 @@ def test_modify_igmp_max_query_response_timer_p0(request):
         {"dut": "l1", "src_address": source, "iif": "l1-r2-eth4", "oil": "l1-i1-eth1"},
         {"dut": "f1", "src_address": source, "iif": "f1-i2-eth1", "oil": "f1-r2-eth3"},
     ]
-    for data in input_dict_5:
-        result = verify_ip_mroutes(
-            tgen, data["dut"], data["src_address"], IGMP_JOIN, data["iif"], data["oil"]
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_5, IGMP_JOIN)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step(
         "Verify 'show ip pim upstream' showing correct OIL and IIF" " on all the nodes"
     )
-    for data in input_dict_5:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_5, IGMP_JOIN)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Delete the PIM and IGMP on FRR1")
     input_dict_1 = {"l1": {"pim": {"disable": ["l1-i1-eth1"]}}}
@@ -90,8 +90,10 @@ from lib.pim import (
     create_igmp_config,
     verify_igmp_groups,
     verify_ip_mroutes,
+    verify_ip_mroutes_bulk,
     verify_pim_interface_traffic,
     verify_upstream_iif,
+    verify_upstream_iif_bulk,
     verify_pim_neighbors,
     verify_pim_state,
     verify_ip_pim_join,
@@ -257,16 +259,12 @@ def config_to_send_igmp_join_and_traffic(
     * `traffic`: multicast traffic, default False
     """
 
-    if join:
-        # Add route to kernal
+    if join or traffic:
+        # Add route to kernal, once even if both join and traffic are set
         result = addKernelRoute(tgen, iperf, iperf_intf, GROUP_RANGE)
         assert result is True, "Testcase {}: Failed Error: {}".format(tc_name, result)
 
     if traffic:
-        # Add route to kernal
-        result = addKernelRoute(tgen, iperf, iperf_intf, GROUP_RANGE)
-        assert result is True, "Testcase {}: Failed Error: {}".format(tc_name, result)
-
         router_list = tgen.routers()
         for router in router_list.keys():
             if router == iperf:
@@ -426,37 +424,18 @@ def test_verify_mroute_and_traffic_when_pimd_restarted_p2(request):
         {"dut": "f1", "src_address": "*", "iif": "f1-c2-eth0", "oil": "f1-i8-eth2"},
         {"dut": "f1", "src_address": source, "iif": "f1-i2-eth1", "oil": "f1-i8-eth2"},
     ]
-    for data in input_dict:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            _IGMP_JOIN_RANGE,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], _IGMP_JOIN_RANGE
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Restart Pimd process on FRR3 node")
     kill_router_daemons(tgen, "f1", ["pimd"])
     start_router_daemons(tgen, "f1", ["pimd"])
 
-    for data in input_dict:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            _IGMP_JOIN_RANGE,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step(
         "After restart of PIMd verify pim nbr is up , IGMP groups"
@@ -473,11 +452,8 @@ def test_verify_mroute_and_traffic_when_pimd_restarted_p2(request):
     result = verify_igmp_groups(tgen, dut, interface, _IGMP_JOIN_RANGE)
     assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], _IGMP_JOIN_RANGE
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Stop the traffic and restart PIMd immediately on FRR3 node")
     dut = "i2"
@@ -495,16 +471,8 @@ def test_verify_mroute_and_traffic_when_pimd_restarted_p2(request):
     input_dict = [
         {"dut": "f1", "src_address": "*", "iif": "f1-c2-eth0", "oil": "f1-i8-eth2"}
     ]
-    for data in input_dict:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            _IGMP_JOIN_RANGE,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     input_dict = [
         {"dut": "f1", "src_address": source, "iif": "f1-i2-eth1", "oil": "none"}
@@ -638,37 +606,18 @@ def test_verify_mroute_and_traffic_when_frr_restarted_p2(request):
         {"dut": "f1", "src_address": "*", "iif": "f1-c2-eth0", "oil": "f1-i8-eth2"},
         {"dut": "f1", "src_address": source, "iif": "f1-i2-eth1", "oil": "f1-i8-eth2"},
     ]
-    for data in input_dict:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            _IGMP_JOIN_RANGE,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], _IGMP_JOIN_RANGE
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Stop and Start the FRR services on FRR3 node")
     stop_router(tgen, "f1")
     start_router(tgen, "f1")
 
-    for data in input_dict:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            _IGMP_JOIN_RANGE,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step(
         "After stop and start of FRR service verify pim nbr is up "
@@ -685,11 +634,8 @@ def test_verify_mroute_and_traffic_when_frr_restarted_p2(request):
     result = verify_igmp_groups(tgen, dut, interface, _IGMP_JOIN_RANGE)
     assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], _IGMP_JOIN_RANGE
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Stop the traffic and stop and start the FRR services on" " FRR3 node")
     shutdown_bringup_interface(tgen, "i2", "i2-f1-eth0", False)
@@ -706,16 +652,8 @@ def test_verify_mroute_and_traffic_when_frr_restarted_p2(request):
     input_dict = [
         {"dut": "f1", "src_address": "*", "iif": "f1-c2-eth0", "oil": "f1-i8-eth2"}
     ]
-    for data in input_dict:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            _IGMP_JOIN_RANGE,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     input_dict = [
         {"dut": "f1", "src_address": source, "iif": "f1-i2-eth1", "oil": "none"}
@@ -846,22 +784,11 @@ def test_verify_SPT_switchover_when_RPT_and_SPT_path_is_different_p0(request):
         {"dut": "f1", "src_address": source, "iif": "f1-i2-eth1", "oil": "f1-r2-eth3"},
         {"dut": "l1", "src_address": source, "iif": "l1-r2-eth4", "oil": "l1-i1-eth1"},
     ]
-    for data in input_dict:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            _IGMP_JOIN_RANGE,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], _IGMP_JOIN_RANGE
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Stop the traffic to all the receivers")
 
@@ -877,16 +804,8 @@ def test_verify_SPT_switchover_when_RPT_and_SPT_path_is_different_p0(request):
     input_dict = [
         {"dut": "c2", "src_address": source, "iif": "c2-f1-eth1", "oil": "none"}
     ]
-    for data in input_dict:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            _IGMP_JOIN_RANGE,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("registerRx and registerStopTx value after traffic sent")
     state_after = verify_pim_interface_traffic(tgen, state_dict)
@@ -1014,22 +933,11 @@ def test_verify_mroute_after_shut_noshut_of_upstream_interface_p1(request):
         {"dut": "f1", "src_address": "*", "iif": "f1-c2-eth0", "oil": "f1-i8-eth2"},
         {"dut": "f1", "src_address": source, "iif": "f1-i2-eth1", "oil": "f1-i8-eth2"},
     ]
-    for data in input_dict:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_2,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict, IGMP_JOIN_RANGE_2)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_2
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict, IGMP_JOIN_RANGE_2)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Shut and No shut interface connected from FHR (FRR3)" " to c2")
     dut = "f1"
@@ -1043,16 +951,8 @@ def test_verify_mroute_after_shut_noshut_of_upstream_interface_p1(request):
     shutdown_bringup_interface(tgen, dut, intf, False)
     shutdown_bringup_interface(tgen, dut, intf, True)
 
-    for data in input_dict:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_2,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict, IGMP_JOIN_RANGE_2)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Shut and No shut FRR1 and FRR3 interface")
     shutdown_bringup_interface(tgen, "l1", "l1-r2-eth4", False)
@@ -1066,16 +966,8 @@ def test_verify_mroute_after_shut_noshut_of_upstream_interface_p1(request):
         "the receivers (S,G) OIL update for all the receivers"
     )
 
-    for data in input_dict:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_2,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict, IGMP_JOIN_RANGE_2)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step(
         "Shut FRR1, FRR3 interface , clear mroute in FRR1"
@@ -1105,16 +997,8 @@ def test_verify_mroute_after_shut_noshut_of_upstream_interface_p1(request):
         " (S,G) OIL update for all the receivers"
     )
 
-    for data in input_dict:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_2,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict, IGMP_JOIN_RANGE_2)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step(
         "Shut and no shut upstream interface from FRR1 to FRR2 and "
@@ -1151,16 +1035,8 @@ def test_verify_mroute_after_shut_noshut_of_upstream_interface_p1(request):
     shutdown_bringup_interface(tgen, dut, intf_l1_r2, True)
     shutdown_bringup_interface(tgen, dut, intf_l1_c1, True)
 
-    for data in input_dict:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_2,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict, IGMP_JOIN_RANGE_2)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Stop the traffic to all the receivers")
     kill_iperf(tgen)
@@ -1287,16 +1163,8 @@ def test_verify_mroute_when_receiver_is_outside_frr_p0(request):
         {"dut": "c2", "src_address": "*", "iif": "c2-c1-eth0", "oil": "c2-i5-eth2"},
         {"dut": "c2", "src_address": source, "iif": "c2-f1-eth1", "oil": "c2-i5-eth2"},
     ]
-    for data in input_dict:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            _IGMP_JOIN_RANGE,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step(
         "FRR3 has (S,G) OIL created toward c1/c2 receiver and FRR1 receiver"
@@ -1317,11 +1185,8 @@ def test_verify_mroute_when_receiver_is_outside_frr_p0(request):
         )
         assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], _IGMP_JOIN_RANGE
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     write_test_footer(tc_name)
 
@@ -1444,16 +1309,8 @@ def test_verify_mroute_when_FRR_is_FHR_and_LHR_p0(request):
         {"dut": "l1", "src_address": "*", "iif": "l1-c1-eth0", "oil": "l1-i1-eth1"},
         {"dut": "l1", "src_address": source, "iif": "l1-r2-eth4", "oil": "l1-i1-eth1"},
     ]
-    for data in input_dict:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            _IGMP_JOIN_RANGE,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Join timer is running in FHR and LHR , verify using" " 'show ip pim state'")
 
@@ -1691,22 +1548,11 @@ def test_verify_mroute_when_5_different_receiver_joining_same_sources_p0(request
             "oil": ["l1-i1-eth1", "l1-i6-eth2"]},
         {"dut": "f1", "src_address": source, "iif": "f1-r2-eth3", "oil": "f1-i8-eth2"},
     ]
-    for data in input_dict_all:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            _IGMP_JOIN_RANGE,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_all, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_all:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], _IGMP_JOIN_RANGE
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_all, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Shut the receiver interface one by one on FRR1 node")
     shutdown_bringup_interface(tgen, "l1", "l1-i1-eth1", False)
@@ -1743,16 +1589,8 @@ def test_verify_mroute_when_5_different_receiver_joining_same_sources_p0(request
     input_dict = [
         {"dut": "f1", "src_address": source, "iif": "f1-r2-eth3", "oil": "f1-i8-eth2"}
     ]
-    for data in input_dict:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            _IGMP_JOIN_RANGE,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("No shut the receiver interface one by one on FRR1 node")
     shutdown_bringup_interface(tgen, "l1", "l1-i1-eth1", True)
@@ -1763,16 +1601,8 @@ def test_verify_mroute_when_5_different_receiver_joining_same_sources_p0(request
         ", no duplicate entries present in mroute"
     )
 
-    for data in input_dict_all:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            _IGMP_JOIN_RANGE,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_all, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     write_test_footer(tc_name)
 
@@ -1909,22 +1739,11 @@ def test_verify_oil_iif_for_mroute_after_shut_noshut_source_interface_p1(request
             "oil": "f1-i8-eth2",
         },
     ]
-    for data in input_dict_all:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            _IGMP_JOIN_RANGE,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_all, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_all:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], _IGMP_JOIN_RANGE
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_all, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Shut the source interface one by one on FRR1")
     shutdown_bringup_interface(tgen, "f1", "f1-i2-eth1", False)
@@ -99,6 +99,7 @@ from lib.pim import (
     create_igmp_config,
     verify_igmp_groups,
     verify_ip_mroutes,
+    verify_ip_mroutes_bulk,
     clear_ip_mroute_verify,
     clear_ip_mroute,
     clear_ip_pim_interface_traffic,
@@ -107,6 +108,7 @@ from lib.pim import (
     verify_pim_config,
     verify_pim_interface,
     verify_upstream_iif,
+    verify_upstream_iif_bulk,
     verify_multicast_traffic,
     verify_pim_rp_info,
     get_refCount_for_mroute,
@@ -277,16 +279,12 @@ def config_to_send_igmp_join_and_traffic(
     * `traffic`: multicast traffic, default False
     """
 
-    if join:
-        # Add route to kernal
+    if join or traffic:
+        # Add route to kernal, once even if both join and traffic are set
         result = addKernelRoute(tgen, iperf, iperf_intf, GROUP_RANGE)
         assert result is True, "Testcase {}: Failed Error: {}".format(tc_name, result)
 
     if traffic:
-        # Add route to kernal
-        result = addKernelRoute(tgen, iperf, iperf_intf, GROUP_RANGE)
-        assert result is True, "Testcase {}: Failed Error: {}".format(tc_name, result)
-
         router_list = tgen.routers()
         for router in router_list.keys():
             if router == iperf:
@@ -568,22 +566,11 @@ def test_verify_oil_when_join_prune_sent_scenario_1_p1(request):
 
     step("Verify mroutes and iff upstream")
 
-    for data in input_dict_all:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_all:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Send the IGMP prune from ixia to (226.1.1.1-5) receiver on " "FRR1 node")
 
@@ -696,22 +683,11 @@ def test_verify_oil_when_join_prune_sent_scenario_1_p1(request):
 
     step("Verify mroutes and iff upstream")
 
-    for data in input_dict_f1:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_f1, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_f1:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_f1, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Send the IGMP prune from ixia to (226.1.1.1-5) receiver on " " FRR3 node")
 
@@ -805,11 +781,8 @@ def test_verify_oil_when_join_prune_sent_scenario_1_p1(request):
     shutdown_bringup_interface(tgen, "f1", intf_f1_i8, True)
     shutdown_bringup_interface(tgen, "l1", intf_l1_i1, True)
 
-    for data in input_dict_l1:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_l1, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     write_test_footer(tc_name)
 
@@ -917,22 +890,11 @@ def test_verify_oil_when_join_prune_sent_scenario_2_p1(request):
 
     step("Verify mroutes and iff upstream")
 
-    for data in input_dict_all:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_all:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Send the IGMP prune from ixia to (226.1.1.1-5) receiver on " "FRR3(r2) node")
 
@@ -989,16 +951,8 @@ def test_verify_oil_when_join_prune_sent_scenario_2_p1(request):
 
     step("Verify mroutes and iff upstream")
 
-    for data in input_dict_l1_r2:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_l1_r2, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Send the IGMP prune from ixia to (226.1.1.1-5) receiver on " "FRR1(l1) node")
 
@@ -1168,22 +1122,11 @@ def test_shut_noshut_source_interface_when_upstream_cleared_from_LHR_p1(request)
         " correct OIL and IIF on all the nodes"
     )
 
-    for data in input_dict_all:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_all:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Shut the source interface from FRR3")
     intf_f1_i2 = topo["routers"]["f1"]["links"]["i2"]["interface"]
@@ -1238,22 +1181,11 @@ def test_shut_noshut_source_interface_when_upstream_cleared_from_LHR_p1(request)
         " with proper OIL and IIF detail"
     )
 
-    for data in input_dict_all:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_all:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("shut and no shut the source interface immediately")
     shutdown_bringup_interface(tgen, "f1", intf_f1_i2, False)
@@ -1264,22 +1196,11 @@ def test_shut_noshut_source_interface_when_upstream_cleared_from_LHR_p1(request)
         "interface verify using 'show ip mroute'"
     )
 
-    for data in input_dict_all:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_all:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     write_test_footer(tc_name)
 
@@ -1391,27 +1312,16 @@ def test_shut_noshut_receiver_interface_when_upstream_cleared_from_LHR_p1(reques
         },
     ]
 
-    for data in input_dict_all:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step(
         "'show ip pim upstream' and 'show ip pim upstream-rpf' showing"
         " correct OIL and IIF on all the nodes"
     )
 
-    for data in input_dict_all:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Shut the source interface FRR1")
     intf_l1_i1 = topo["routers"]["l1"]["links"]["i1"]["interface"]
@@ -1452,22 +1362,11 @@ def test_shut_noshut_receiver_interface_when_upstream_cleared_from_LHR_p1(reques
         " with proper OIL and IIF detail"
     )
 
-    for data in input_dict_all:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_all:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("shut and no shut the source interface immediately")
     shutdown_bringup_interface(tgen, "f1", intf_f1_i2, False)
@@ -1479,22 +1378,11 @@ def test_shut_noshut_receiver_interface_when_upstream_cleared_from_LHR_p1(reques
         "with proper OIL and IIF detail"
     )
 
-    for data in input_dict_all:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_all:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     write_test_footer(tc_name)
 
@@ -1613,22 +1501,11 @@ def test_verify_remove_add_igmp_config_to_receiver_interface_p0(request):
         },
     ]
 
-    for data in input_dict_all:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_all:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step(
         "Remove igmp 'no ip igmp' and 'no ip igmp version 2' from"
@@ -1697,22 +1574,11 @@ def test_verify_remove_add_igmp_config_to_receiver_interface_p0(request):
         " using show ip pim upstream and show ip multicast'"
     )
 
-    for data in input_dict_all:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_all:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     result = verify_multicast_traffic(tgen, input_traffic)
     assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
@@ -1807,22 +1673,11 @@ def test_verify_remove_add_igmp_config_to_receiver_interface_p0(request):
         },
     ]
 
-    for data in input_dict_l1_f1:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_l1_f1, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_l1_f1:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_l1_f1, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     result = verify_multicast_traffic(tgen, input_traffic)
     assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
@@ -1989,22 +1844,11 @@ def test_verify_remove_add_igmp_commands_when_pim_configured_p0(request):
         },
     ]
 
-    for data in input_dict_all:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_all:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step(
         "Verification: After configuring IGMP related config , "
@@ -2460,22 +2304,11 @@ def test_pim_dr_priority_p0(request):
         },
     ]
 
-    for data in input_dict_all:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_all:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Configure 'ip pim drpriority 10' on receiver interface on FRR1(LHR)")
 
@@ -2497,22 +2330,11 @@ def test_pim_dr_priority_p0(request):
     result = verify_pim_config(tgen, input_dict_dr)
     assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_all:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_all:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Configure 'ip pim drpriority 20' on receiver interface on FRR3(FHR)")
 
@@ -2534,22 +2356,11 @@ def test_pim_dr_priority_p0(request):
     result = verify_pim_config(tgen, input_dict_dr)
     assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_all:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_all:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step(
         "PIM is enable on FRR1, FRR2 interface and neighbor is up, "
@@ -2629,22 +2440,11 @@ def test_pim_dr_priority_p0(request):
     result = verify_pim_config(tgen, input_dict_dr)
     assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_all:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_all:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     write_test_footer(tc_name)
 
@@ -2883,22 +2683,11 @@ def test_mroute_after_removing_RP_sending_IGMP_prune_p2(request):
 
     step("Verify mroutes and iff upstream")
 
-    for data in input_dict_all:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_all:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Remove the RP config for both the range from all the nodes")
 
@@ -2962,16 +2751,8 @@ def test_mroute_after_removing_RP_sending_IGMP_prune_p2(request):
         )
         logger.info("Expected Behaviour: {}".format(result))
 
-    for data in input_dict_sg:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_sg, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Send prune from receiver-1 (using ctrl+c) on iperf interface")
     kill_iperf(tgen)
@@ -3048,16 +2829,8 @@ def test_mroute_after_removing_RP_sending_IGMP_prune_p2(request):
         result = iperfSendIGMPJoin(tgen, recvr, IGMP_JOIN_RANGE_1, join_interval=1)
         assert result is True, "Testcase {}: Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_starg:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_starg, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Send traffic from FHR and verify mroute upstream")
 
@@ -3072,16 +2845,8 @@ def test_mroute_after_removing_RP_sending_IGMP_prune_p2(request):
 
     source_i2 = topo["routers"]["i6"]["links"]["l1"]["ipv4"].split("/")[0]
 
-    for data in input_dict_sg:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_sg, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     write_test_footer(tc_name)
 
@@ -3210,22 +2975,11 @@ def test_prune_sent_to_LHR_and_FHR_when_PIMnbr_down_p2(request):
 
     step("Verify mroutes and iff upstream")
 
-    for data in input_dict_all:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_all:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_all, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
     step("Verify mcast traffic received")
     intf_f1_i8 = topo["routers"]["f1"]["links"]["i8"]["interface"]
     input_traffic = {"f1": {"traffic_sent": [intf_f1_i8]}}
@@ -3308,16 +3062,8 @@ def test_prune_sent_to_LHR_and_FHR_when_PIMnbr_down_p2(request):
         )
         logger.info("Expected Behaviour: {}".format(result))
 
-    for data in input_dict_sg_i1:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_sg_i1, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Verify upstream after Shut the link from LHR to RP from RP node")
 
@@ -3337,11 +3083,8 @@ def test_prune_sent_to_LHR_and_FHR_when_PIMnbr_down_p2(request):
         )
         logger.info("Expected Behaviour: {}".format(result))
 
-    for data in input_dict_sg_i1:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_sg_i1, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("No shut the link from LHR to RP from RP node")
 
@@ -3364,58 +3107,25 @@ def test_prune_sent_to_LHR_and_FHR_when_PIMnbr_down_p2(request):
 
     step("Verify mroute  after No shut the link from LHR to RP from RP node")
 
-    for data in input_dict_starg:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_starg, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_sg_i2:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_sg_i2, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_sg_i1:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_sg_i1, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Verify upstrem after No shut the link from LHR to RP from RP node")
 
-    for data in input_dict_starg:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_starg, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_sg_i1:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_sg_i1, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_sg_i2:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_sg_i2, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Verify mcast traffic received after noshut LHR to RP from RP node")
 
@@ -3442,41 +3152,19 @@ def test_prune_sent_to_LHR_and_FHR_when_PIMnbr_down_p2(request):
 
     step("Verify mroute after Shut the link from FHR to RP from RP node")
 
-    for data in input_dict_starg:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_starg, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_sg_i1:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_sg_i1, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Verify upstream after Shut the link from FHR to RP from RP node")
 
-    for data in input_dict_starg:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_starg, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_sg_i1:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_sg_i1, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     for data in input_dict_sg_i2_l1:
         result = verify_upstream_iif(
@@ -3515,58 +3203,25 @@ def test_prune_sent_to_LHR_and_FHR_when_PIMnbr_down_p2(request):
 
     step("Verify mroute after Noshut the link from FHR to RP from RP node")
 
-    for data in input_dict_starg:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_starg, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_sg_i2:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_sg_i2, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_sg_i1:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_sg_i1, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Verify mroute after Noshut the link from FHR to RP from RP node")
 
-    for data in input_dict_starg:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_starg, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_sg_i1:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_sg_i1, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_sg_i2:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_sg_i2, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Verify mcast traffic received after noshut FHR to RP from RP node")
     intf_f1_i8 = topo["routers"]["f1"]["links"]["i8"]["interface"]
@@ -3594,40 +3249,18 @@ def test_prune_sent_to_LHR_and_FHR_when_PIMnbr_down_p2(request):
 
     step("Verify mroute after Shut the link from FHR to RP from FHR node")
 
-    for data in input_dict_starg:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_starg, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_sg_i1:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_sg_i1, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Verify upstream after Shut the link from FHR to RP from FHR node")
-    for data in input_dict_starg:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_starg, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_sg_i1:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_sg_i1, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     for data in input_dict_sg_i2_l1:
         result = verify_upstream_iif(
@@ -3665,58 +3298,25 @@ def test_prune_sent_to_LHR_and_FHR_when_PIMnbr_down_p2(request):
 
     step("Verify mroute after No Shut the link from FHR to RP from FHR node")
 
-    for data in input_dict_starg:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_starg, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_sg_i2:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_sg_i2, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_sg_i1:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_sg_i1, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Verify upstream after No Shut the link from FHR to RP from FHR node")
 
-    for data in input_dict_starg:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_starg, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_sg_i1:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_sg_i1, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_sg_i2:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], IGMP_JOIN_RANGE_1
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_sg_i2, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step("Verify mcast traffic received after noshut FHR to RP from FHR node")
     intf_f1_i8 = topo["routers"]["f1"]["links"]["i8"]["interface"]
@@ -4024,22 +3624,11 @@ def test_verify_multicast_traffic_when_LHR_connected_to_RP_p1(request):
         },
     ]
 
-    for data in input_dict_all:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            _IGMP_JOIN_RANGE,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_all, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_all:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], _IGMP_JOIN_RANGE
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_all, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step(
         "Multicast traffic is flowing for all the groups verify"
@@ -4109,22 +3698,11 @@ def test_verify_multicast_traffic_when_LHR_connected_to_RP_p1(request):
         "'show ip mroute' 'show ip pim upstream'"
     )
 
-    for data in input_dict_r2:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            _IGMP_JOIN_RANGE,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_r2, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_r2:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], _IGMP_JOIN_RANGE
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_r2, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step(
         "Multicast traffic is resumed for all the groups verify "
@@ -4178,22 +3756,11 @@ def test_verify_multicast_traffic_when_LHR_connected_to_RP_p1(request):
         "'show ip mroute' 'show ip pim upstream'"
     )
 
-    for data in input_dict_l1:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            _IGMP_JOIN_RANGE,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_l1, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_l1:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], _IGMP_JOIN_RANGE
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_l1, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step(
         "Multicast traffic is resumed for all the groups verify "
@@ -4253,22 +3820,11 @@ def test_verify_multicast_traffic_when_LHR_connected_to_RP_p1(request):
         "'show ip mroute' 'show ip pim upstream'"
     )
 
-    for data in input_dict_all:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            _IGMP_JOIN_RANGE,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_all, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_all:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], _IGMP_JOIN_RANGE
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_all, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step(
         "Multicast traffic is resumed for all the groups verify "
@@ -4321,22 +3877,11 @@ def test_verify_multicast_traffic_when_LHR_connected_to_RP_p1(request):
         "'show ip mroute' 'show ip pim upstream'"
     )
 
-    for data in input_dict_all:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            _IGMP_JOIN_RANGE,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_all, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_all:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], _IGMP_JOIN_RANGE
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_all, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     step(
         "Multicast traffic is resumed for all the groups verify "
@@ -4464,22 +4009,11 @@ def test_verify_multicast_traffic_when_FHR_connected_to_RP_p1(request):
         },
     ]
 
-    for data in input_dict_all:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            _IGMP_JOIN_RANGE,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_all, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_all:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], _IGMP_JOIN_RANGE
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_all, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     intf_l1_r2 = topo["routers"]["l1"]["links"]["r2"]["interface"]
     intf_f1_r2 = topo["routers"]["f1"]["links"]["r2"]["interface"]
@@ -4535,22 +4069,11 @@ def test_verify_multicast_traffic_when_FHR_connected_to_RP_p1(request):
         "'show ip mroute' 'show ip pim upstream'"
     )
 
-    for data in input_dict_l1:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            _IGMP_JOIN_RANGE,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_l1, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_l1:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], _IGMP_JOIN_RANGE
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_l1, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     result = verify_multicast_traffic(tgen, input_traffic)
     assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
@@ -4601,22 +4124,11 @@ def test_verify_multicast_traffic_when_FHR_connected_to_RP_p1(request):
         "'show ip mroute' 'show ip pim upstream'"
     )
 
-    for data in input_dict_r2:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            _IGMP_JOIN_RANGE,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_r2, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_r2:
-        result = verify_upstream_iif(
-            tgen, data["dut"], data["iif"], data["src_address"], _IGMP_JOIN_RANGE
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_upstream_iif_bulk(tgen, input_dict_r2, _IGMP_JOIN_RANGE)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     result = verify_multicast_traffic(tgen, input_traffic)
     assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
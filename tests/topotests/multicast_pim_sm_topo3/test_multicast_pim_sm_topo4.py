@@ -86,6 +86,7 @@ from lib.pim import (
     create_igmp_config,
     verify_igmp_groups,
     verify_ip_mroutes,
+    verify_ip_mroutes_bulk,
     clear_ip_pim_interface_traffic,
     verify_igmp_config,
     verify_pim_neighbors,
@@ -245,16 +246,12 @@ def config_to_send_igmp_join_and_traffic(
     * `traffic`: multicast traffic, default False
     """
 
-    if join:
-        # Add route to kernal
+    if join or traffic:
+        # Add route to kernal, once even if both join and traffic are set
         result = addKernelRoute(tgen, iperf, iperf_intf, GROUP_RANGE)
         assert result is True, "Testcase {}: Failed Error: {}".format(tc_name, result)
 
     if traffic:
-        # Add route to kernal
-        result = addKernelRoute(tgen, iperf, iperf_intf, GROUP_RANGE)
-        assert result is True, "Testcase {}: Failed Error: {}".format(tc_name, result)
-
         router_list = tgen.routers()
         for router in router_list.keys():
             if router == iperf:
@@ -1005,27 +1002,11 @@ def test_PIM_hello_tx_rx_p1(request):
     ]
 
     step("(*,G) and (S,G) created on f1 and node verify using 'show ip mroute'")
-    for data in input_dict_sg:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_sg, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
-    for data in input_dict_starg:
-        result = verify_ip_mroutes(
-            tgen,
-            data["dut"],
-            data["src_address"],
-            IGMP_JOIN_RANGE_1,
-            data["iif"],
-            data["oil"],
-        )
-        assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
+    result = verify_ip_mroutes_bulk(tgen, input_dict_starg, IGMP_JOIN_RANGE_1)
+    assert result is True, "Testcase {} : Failed Error: {}".format(tc_name, result)
 
     intf_l1_c1 = topo["routers"]["l1"]["links"]["c1"]["interface"]
     intf_c1_l1 = topo["routers"]["c1"]["links"]["l1"]["interface"]
@@ -1040,8 +1021,9 @@ def test_PIM_hello_tx_rx_p1(request):
     c1_state_before = verify_pim_interface_traffic(tgen, state_dict)
     assert isinstance(
         c1_state_before, dict
-    ), "Testcase{} : Failed \n state_before is not dictionary \n "
-    "Error: {}".format(tc_name, result)
+    ), "Testcase{} : Failed \n state_before is not dictionary \n Error: {}".format(
+        tc_name, result
+    )
 
     step("Flap PIM nbr while doing interface c1-l1 interface shut from f1 side")
     shutdown_bringup_interface(tgen, "c1", intf_c1_l1, False)
@@ -1056,8 +1038,9 @@ def test_PIM_hello_tx_rx_p1(request):
     c1_state_after = verify_pim_interface_traffic(tgen, state_dict)
     assert isinstance(
         c1_state_after, dict
-    ), "Testcase{} : Failed \n state_before is not dictionary \n "
-    "Error: {}".format(tc_name, result)
+    ), "Testcase{} : Failed \n state_after is not dictionary \n Error: {}".format(
+        tc_name, result
+    )
 
     step("verify stats not increamented on c1")
     result = verify_state_incremented(c1_state_before, c1_state_after)
@@ -1075,8 +1058,9 @@ def test_PIM_hello_tx_rx_p1(request):
     l1_state_before = verify_pim_interface_traffic(tgen, l1_state_dict)
     assert isinstance(
         l1_state_before, dict
-    ), "Testcase{} : Failed \n state_before is not dictionary \n "
-    "Error: {}".format(tc_name, result)
+    ), "Testcase{} : Failed \n state_before is not dictionary \n Error: {}".format(
+        tc_name, result
+    )
 
     step("Flap PIM nbr while doing interface r2-c1 shut from r2 side")
     shutdown_bringup_interface(tgen, "l1", intf_l1_c1, False)
@@ -1091,8 +1075,9 @@ def test_PIM_hello_tx_rx_p1(request):
     l1_state_after = verify_pim_interface_traffic(tgen, l1_state_dict)
     assert isinstance(
         l1_state_after, dict
-    ), "Testcase{} : Failed \n state_before is not dictionary \n "
-    "Error: {}".format(tc_name, result)
+    ), "Testcase{} : Failed \n state_after is not dictionary \n Error: {}".format(
+        tc_name, result
+    )
 
     step("verify stats not increamented on l1")
     result = verify_state_incremented(l1_state_before, l1_state_after)
@@ -1116,8 +1101,9 @@ def test_PIM_hello_tx_rx_p1(request):
     c1_state_before = verify_pim_interface_traffic(tgen, state_dict)
     assert isinstance(
         c1_state_before, dict
-    ), "Testcase{} : Failed \n state_before is not dictionary \n "
-    "Error: {}".format(tc_name, result)
+    ), "Testcase{} : Failed \n state_before is not dictionary \n Error: {}".format(
+        tc_name, result
+    )
 
     step("Flap c1-r2 pim nbr while changing ip address from c1 side")
     c1_l1_ip_subnet = topo["routers"]["c1"]["links"]["l1"]["ipv4"]
@@ -1139,8 +1125,9 @@ def test_PIM_hello_tx_rx_p1(request):
     c1_state_after = verify_pim_interface_traffic(tgen, state_dict)
     assert isinstance(
         c1_state_after, dict
-    ), "Testcase{} : Failed \n state_before is not dictionary \n "
-    "Error: {}".format(tc_name, result)
+    ), "Testcase{} : Failed \n state_after is not dictionary \n Error: {}".format(
+        tc_name, result
+    )
 
     step("verify stats not increamented on c1")
     result = verify_state_incremented(c1_state_before, c1_state_after)